@@ -0,0 +1,94 @@
+import random
+
+import pygame
+
+# Unit steps in the order the keyboard controller checks its keys
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class KeyboardController:
+    """Read the arrow keys; the default controller for interactive play."""
+
+    KEYS = {
+        pygame.K_LEFT: (-1, 0),
+        pygame.K_RIGHT: (1, 0),
+        pygame.K_UP: (0, -1),
+        pygame.K_DOWN: (0, 1)
+    }
+
+    def direction(self, game):
+        """
+        Return the requested step for this tick.
+
+        Args:
+            game (Game): The running game
+
+        Returns:
+            tuple: (dx, dy) of the first held arrow key that is not blocked
+                by a wall, or None
+        """
+        keys = pygame.key.get_pressed()
+        x, y = game.player_grid
+        for key, (dx, dy) in self.KEYS.items():
+            if keys[key] and not game.maze.has_wall(x, y, dx, dy):
+                return dx, dy
+        return None
+
+    def idle(self, game):
+        """Return True while no arrow key is held, so the game may sleep."""
+        keys = pygame.key.get_pressed()
+        return not any(keys[key] for key in self.KEYS)
+
+
+class RandomAgent:
+    """Wander the maze, picking a random open direction each move."""
+
+    def __init__(self, seed=None):
+        """
+        Initialize the agent.
+
+        Args:
+            seed: Seed for the agent's own random generator
+        """
+        self.rng = random.Random(seed)
+
+    def direction(self, game):
+        """Return a random step that is not blocked by a wall."""
+        x, y = game.player_grid
+        open_steps = [(dx, dy) for dx, dy in DIRECTIONS
+                      if not game.maze.has_wall(x, y, dx, dy)]
+        return self.rng.choice(open_steps) if open_steps else None
+
+
+class ScriptedAgent:
+    """Replay a fixed sequence of steps (None entries wait a tick)."""
+
+    def __init__(self, steps, loop=False):
+        """
+        Initialize the agent.
+
+        Args:
+            steps (list): (dx, dy) tuples or None, consumed one per request
+            loop (bool): Start over when the script runs out
+        """
+        self.steps = list(steps)
+        self.loop = loop
+        self.index = 0
+
+    def direction(self, game):
+        """Return the next scripted step, or None once the script is done."""
+        if self.index >= len(self.steps):
+            if not self.loop or not self.steps:
+                return None
+            self.index = 0
+        step = self.steps[self.index]
+        self.index += 1
+        return step
+
+
+class GreedyAgent:
+    """Walk the shortest path to the nearest remaining patch."""
+
+    def direction(self, game):
+        """Return the first step of a shortest path to the closest patch."""
+        return game.distances.step(*game.player_grid)
@@ -0,0 +1,187 @@
+import os
+import threading
+
+import pygame
+
+from Game.atlas import load_atlas
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+# Extensions tried in order when looking a sound up by name
+SOUND_EXTENSIONS = (".wav", ".mp3", ".ogg")
+
+
+class _SilentSound:
+    """Stand-in for pygame.mixer.Sound when no audio device is available."""
+
+    def play(self, *args, **kwargs):
+        pass
+
+    def stop(self):
+        pass
+
+
+class AssetManager:
+    """
+    Sprites and sounds loaded on first use and cached.
+
+    Nothing is read at construction. Sprites come from the sprite atlas
+    (one image for all of them, packed on first run), and are handed out
+    as subsurfaces of it. Missing or unreadable files are replaced by
+    placeholders built in memory, never written to disk.
+    Sounds and the background music can be loaded on a background thread
+    so the first frame does not wait for audio decoding.
+    """
+
+    def __init__(self, base_path=ASSETS_DIR, use_atlas=True):
+        """
+        Initialize an empty cache.
+
+        Args:
+            base_path (str): Folder holding the "sprites" and "sounds" folders
+            use_atlas (bool): Load sprites from the packed atlas instead of
+                one file each
+        """
+        self.base_path = base_path
+        self.use_atlas = use_atlas
+        self._atlas = None
+        self._images = {}
+        self._sounds = {}
+        self._lock = threading.Lock()
+        self._audio_thread = None
+        self._music_loaded = False
+        self._music_loops = None  # Loop count requested before the music was ready
+
+    def image(self, name, placeholder=None):
+        """
+        Return a sprite converted for fast blitting, loading it on first use.
+
+        Args:
+            name (str): File name without extension under sprites/
+            placeholder (callable): Returns a surface to use if the file
+                cannot be loaded (defaults to a magenta square)
+
+        Returns:
+            pygame.Surface: The cached sprite
+        """
+        surface = self._images.get(name)
+        if surface is not None:
+            return surface
+        atlas = self.atlas()
+        if atlas is not None and name in atlas:
+            # Already in display format, shares the atlas pixels
+            with self._lock:
+                return self._images.setdefault(name, atlas.get(name))
+        try:
+            surface = pygame.image.load(os.path.join(self.base_path, "sprites", name + ".png"))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Asset error: {e}")
+            if placeholder is not None:
+                surface = placeholder()
+            else:
+                surface = pygame.Surface((32, 32), pygame.SRCALPHA)
+                surface.fill((255, 0, 255))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        with self._lock:
+            return self._images.setdefault(name, surface)
+
+    def atlas(self):
+        """
+        Return the sprite atlas, loading (or packing) it on first use.
+
+        Returns:
+            SpriteAtlas: The atlas, or None if disabled or unavailable
+        """
+        if self._atlas is None and self.use_atlas:
+            try:
+                self._atlas = load_atlas(os.path.join(self.base_path, "sprites"))
+            except (OSError, pygame.error) as e:
+                print(f"Atlas error: {e}")
+                self.use_atlas = False
+        return self._atlas
+
+    def _sound_path(self, name):
+        """Return the first existing file for a sound name, or None."""
+        for extension in SOUND_EXTENSIONS:
+            path = os.path.join(self.base_path, "sounds", name + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _load_sound(self, name):
+        """Decode a sound, falling back to one second of silence."""
+        try:
+            path = self._sound_path(name)
+            if path is not None:
+                return pygame.mixer.Sound(path)
+            print(f"Asset error: no sound named '{name}'")
+            return pygame.mixer.Sound(buffer=bytearray(44100))
+        except pygame.error as e:
+            print(f"Asset error: {e}")
+            return _SilentSound()
+
+    def sound(self, name):
+        """
+        Return a sound, loading it now if the background loader has not yet.
+
+        Args:
+            name (str): File name without extension under sounds/
+
+        Returns:
+            pygame.mixer.Sound: The cached sound (silent if unavailable)
+        """
+        sound = self._sounds.get(name)
+        if sound is None:
+            sound = self._load_sound(name)
+            with self._lock:
+                sound = self._sounds.setdefault(name, sound)
+        return sound
+
+    def load_audio_async(self, names, music=None):
+        """
+        Load sounds and the background music on a background thread.
+
+        Args:
+            names (iterable): Sound names to decode into the cache
+            music (str): Name of the music track to load, if any
+        """
+        self._audio_thread = threading.Thread(
+            target=self._load_audio, args=(tuple(names), music), name="asset-audio", daemon=True)
+        self._audio_thread.start()
+
+    def _load_audio(self, names, music):
+        """Background thread: decode the sounds, then prepare the music."""
+        for name in names:
+            self.sound(name)
+        if music is None:
+            return
+        path = self._sound_path(music)
+        try:
+            if path is None:
+                raise pygame.error(f"no music named '{music}'")
+            pygame.mixer.music.load(path)
+        except pygame.error as e:
+            print(f"Asset error: {e}")
+            return
+        with self._lock:
+            self._music_loaded = True
+            if self._music_loops is not None:
+                pygame.mixer.music.play(self._music_loops)
+
+    def play_music(self, loops=-1):
+        """
+        Play the background music, or as soon as it has finished loading.
+
+        Args:
+            loops (int): Repeat count passed to pygame.mixer.music.play
+        """
+        with self._lock:
+            if self._music_loaded:
+                pygame.mixer.music.play(loops)
+            else:
+                self._music_loops = loops
+
+    def wait(self):
+        """Block until background audio loading has finished."""
+        if self._audio_thread is not None:
+            self._audio_thread.join()
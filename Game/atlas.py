@@ -0,0 +1,194 @@
+import json
+import math
+import os
+import sys
+
+import pygame
+
+ATLAS_VERSION = 1
+
+
+def pack(sizes, padding=1):
+    """
+    Place rectangles on shelves: tallest first, left to right, wrapping
+    to a new shelf when the row is full.
+
+    The row width is chosen so the atlas comes out roughly square.
+
+    Args:
+        sizes (dict): name -> (width, height)
+        padding (int): Empty pixels between neighbors
+
+    Returns:
+        tuple: ({name: pygame.Rect}, (atlas width, atlas height))
+    """
+    if not sizes:
+        return {}, (0, 0)
+    area = sum((w + padding) * (h + padding) for w, h in sizes.values())
+    row_width = max(max(w for w, _ in sizes.values()), math.ceil(math.sqrt(area)))
+    rects = {}
+    x = y = shelf = used = 0
+    for name in sorted(sizes, key=lambda name: (-sizes[name][1], name)):
+        w, h = sizes[name]
+        if x and x + w > row_width:
+            y += shelf + padding
+            x = shelf = 0
+        rects[name] = pygame.Rect(x, y, w, h)
+        used = max(used, x + w)
+        x += w + padding
+        shelf = max(shelf, h)
+    return rects, (used, y + shelf)
+
+
+def _sources(sprites_dir):
+    """Return name -> [mtime_ns, size] for every PNG in a folder."""
+    sources = {}
+    with os.scandir(sprites_dir) as entries:
+        for entry in entries:
+            name, extension = os.path.splitext(entry.name)
+            if extension.lower() == ".png" and entry.is_file():
+                stat = entry.stat()
+                sources[name] = [stat.st_mtime_ns, stat.st_size]
+    return sources
+
+
+class SpriteAtlas:
+    """
+    Every sprite packed into one surface.
+
+    ``get`` hands out subsurfaces that share the atlas pixels; ``area``
+    gives the source rect, so many sprites can be drawn with a single
+    ``Surface.blits`` from ``surface``.
+    """
+
+    def __init__(self, surface, rects):
+        """
+        Initialize the atlas.
+
+        Args:
+            surface (pygame.Surface): The packed sprites
+            rects (dict): name -> pygame.Rect of each sprite in the surface
+        """
+        self.surface = surface
+        self.rects = rects
+        self._subsurfaces = {}
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def area(self, name):
+        """Return the rect of a sprite within ``surface``."""
+        return self.rects[name]
+
+    def get(self, name):
+        """
+        Return a sprite as a subsurface of the atlas.
+
+        Args:
+            name (str): Sprite file name without extension
+
+        Returns:
+            pygame.Surface: Subsurface sharing the atlas pixels
+        """
+        subsurface = self._subsurfaces.get(name)
+        if subsurface is None:
+            subsurface = self._subsurfaces[name] = self.surface.subsurface(self.rects[name])
+        return subsurface
+
+    @classmethod
+    def build(cls, sprites_dir, image_path=None, index_path=None):
+        """
+        Pack every PNG of a folder into an atlas, saving it if paths are given.
+
+        Args:
+            sprites_dir (str): Folder of sprite PNGs
+            image_path (str): Where to save the atlas image
+            index_path (str): Where to save the JSON index of sub-rects
+
+        Returns:
+            SpriteAtlas: The packed atlas
+        """
+        sources = _sources(sprites_dir)
+        images = {name: pygame.image.load(os.path.join(sprites_dir, name + ".png"))
+                  for name in sources}
+        rects, size = pack({name: image.get_size() for name, image in images.items()})
+        surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+        surface.fill((0, 0, 0, 0))
+        surface.blits([(images[name], rect) for name, rect in rects.items()], doreturn=False)
+        if image_path and index_path:
+            pygame.image.save(surface, image_path)
+            index = {
+                "version": ATLAS_VERSION,
+                "image": os.path.basename(image_path),
+                "sprites": {name: list(rect) for name, rect in rects.items()},
+                "sources": sources,
+            }
+            with open(index_path, "w") as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+        return cls(surface, rects)
+
+    @classmethod
+    def load(cls, index_path):
+        """
+        Load a saved atlas.
+
+        Args:
+            index_path (str): JSON index written by ``build``
+
+        Returns:
+            SpriteAtlas: The atlas
+        """
+        with open(index_path) as f:
+            index = json.load(f)
+        image_path = os.path.join(os.path.dirname(index_path), index["image"])
+        surface = pygame.image.load(image_path)
+        rects = {name: pygame.Rect(rect) for name, rect in index["sprites"].items()}
+        return cls(surface, rects)
+
+
+def load_atlas(sprites_dir, atlas_dir=None):
+    """
+    Load the atlas for a sprite folder, (re)building it on first run or
+    when a sprite was added, removed or changed.
+
+    Args:
+        sprites_dir (str): Folder of sprite PNGs
+        atlas_dir (str): Folder for atlas.png and atlas.json (defaults to
+            sprites_dir/../atlas)
+
+    Returns:
+        SpriteAtlas: The atlas, converted for the display if one is open
+    """
+    atlas_dir = atlas_dir or os.path.join(os.path.dirname(sprites_dir), "atlas")
+    index_path = os.path.join(atlas_dir, "atlas.json")
+    atlas = None
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index.get("version") == ATLAS_VERSION and index.get("sources") == _sources(sprites_dir):
+            atlas = SpriteAtlas.load(index_path)
+    except (OSError, ValueError, KeyError, pygame.error):
+        pass
+    if atlas is None:
+        try:
+            os.makedirs(atlas_dir, exist_ok=True)
+            atlas = SpriteAtlas.build(sprites_dir, os.path.join(atlas_dir, "atlas.png"), index_path)
+        except OSError as e:
+            # Read-only install: pack in memory for this run
+            print(f"Atlas error: {e}")
+            atlas = SpriteAtlas.build(sprites_dir)
+    if pygame.display.get_surface() is not None:
+        atlas.surface = atlas.surface.convert_alpha()
+    return atlas
+
+
+if __name__ == "__main__":
+    # Build step: python -m Game.atlas [sprites_dir] [atlas_dir]
+    from Game.assets import ASSETS_DIR
+
+    sprites = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ASSETS_DIR, "sprites")
+    output = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(sprites), "atlas")
+    os.makedirs(output, exist_ok=True)
+    built = SpriteAtlas.build(sprites, os.path.join(output, "atlas.png"),
+                              os.path.join(output, "atlas.json"))
+    print(f"Packed {len(built.rects)} sprites into {built.surface.get_size()}")
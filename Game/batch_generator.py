@@ -0,0 +1,236 @@
+import numpy as np
+
+from Game.maze_generator import (
+    MazeGenerator, WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT, ALL_WALLS, VISITED
+)
+
+# Registry of vectorized batch algorithms, keyed by name
+BATCH_ALGORITHMS = {}
+# Cells processed per vectorized Kruskal pass (keeps working arrays in cache)
+KRUSKAL_CHUNK_CELLS = 1 << 18
+
+
+def register_batch_algorithm(name):
+    """
+    Register a vectorized batch generator under the given name.
+
+    The function is called as ``func(masks, rng)`` with a ``(N, H, W)``
+    uint8 array whose cells all have every wall up, and must carve N
+    perfect mazes into it in place.
+
+    Args:
+        name (str): Name used to select the algorithm
+
+    Returns:
+        function: Decorator that registers and returns the function
+    """
+    def decorator(func):
+        BATCH_ALGORITHMS[name] = func
+        return func
+    return decorator
+
+
+def generate_batch(count, width, height, algorithm="binary_tree", seed=None):
+    """
+    Generate many mazes at once as a single wall-mask array.
+
+    Cells use the same byte layout as ``MazeGenerator.cells`` (wall bits
+    plus the visited flag), so ``masks[i]`` can be copied straight into a
+    maze.
+
+    Args:
+        count (int): Number of mazes to generate
+        width (int): Width of each maze in cells
+        height (int): Height of each maze in cells
+        algorithm (str): Name of a registered batch algorithm
+        seed: Seed for ``numpy.random.default_rng``
+
+    Returns:
+        numpy.ndarray: ``(count, height, width)`` uint8 wall masks
+
+    Raises:
+        ValueError: If no batch algorithm is registered under that name
+    """
+    try:
+        generate = BATCH_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown batch algorithm '{algorithm}'. "
+                         f"Available: {', '.join(sorted(BATCH_ALGORITHMS))}") from None
+    masks = np.full((count, height, width), ALL_WALLS | VISITED, dtype=np.uint8)
+    generate(masks, np.random.default_rng(seed))
+    return masks
+
+
+def to_mazes(masks, cell_size=40, algorithm=None):
+    """
+    Convert a batch of wall masks into MazeGenerator instances.
+
+    Args:
+        masks (numpy.ndarray): ``(N, H, W)`` uint8 wall masks
+        cell_size (int): Size of each cell in pixels
+        algorithm (str): Algorithm name recorded on each maze
+
+    Returns:
+        list: One MazeGenerator per maze in the batch
+    """
+    _, height, width = masks.shape
+    return [MazeGenerator.from_cells(mask.tobytes(), width, height, cell_size, algorithm)
+            for mask in masks]
+
+
+def _carve_east(masks, east):
+    """Open the wall between each selected cell and its right-hand neighbor."""
+    east = east.view(np.uint8)
+    masks[:, :, :-1] &= ~(east * np.uint8(WALL_RIGHT))
+    masks[:, :, 1:] &= ~(east * np.uint8(WALL_LEFT))
+
+
+def _carve_north(masks, north):
+    """Open the wall between each selected cell and the cell above it."""
+    north = north.view(np.uint8)
+    masks[:, 1:, :] &= ~(north * np.uint8(WALL_TOP))
+    masks[:, :-1, :] &= ~(north * np.uint8(WALL_BOTTOM))
+
+
+@register_batch_algorithm("binary_tree")
+def batch_binary_tree(masks, rng):
+    """Binary tree: every cell except the origin opens north or west."""
+    count, height, width = masks.shape
+    west = rng.random((count, height, width)) < 0.5
+    west[:, 0, :] = True   # Top row can only go west
+    west[:, :, 0] = False  # Left column can only go north
+    # A cell opening west is the east neighbor of the cell to its left
+    _carve_east(masks, west[:, :, 1:])
+    north = ~west
+    north[:, 0, 0] = False
+    _carve_north(masks, north[:, 1:, :])
+
+
+@register_batch_algorithm("sidewinder")
+def batch_sidewinder(masks, rng):
+    """Sidewinder: random horizontal runs, each opened north at a random cell."""
+    count, height, width = masks.shape
+    # True where the run continues east; the last column always closes the run
+    east = rng.random((count, height, width)) < 0.5
+    east[:, :, -1] = False
+    east[:, 0, :-1] = True
+    _carve_east(masks, east[:, :, :-1])
+    if height == 1:
+        return
+
+    rows = east[:, 1:, :]
+    columns = np.arange(width)
+    # Each run starts one past the previous closing cell
+    closes = ~rows
+    starts = np.where(closes, columns + 1, 0)
+    starts = np.concatenate([np.zeros_like(starts[..., :1]), starts[..., :-1]], axis=-1)
+    starts = np.maximum.accumulate(starts, axis=-1)
+    # For each closing cell, pick one cell of its run to open upwards
+    picks = starts + (rng.random(rows.shape) * (columns - starts + 1)).astype(np.intp)
+    n, y, x = np.nonzero(closes)
+    north = np.zeros((count, height - 1, width), dtype=bool)
+    north[n, y, picks[n, y, x]] = True
+    _carve_north(masks, north)
+
+
+@register_batch_algorithm("kruskal")
+def batch_kruskal(masks, rng):
+    """
+    Randomized Kruskal's algorithm, vectorized across the batch.
+
+    Kruskal over a random edge order builds the minimum spanning tree of
+    random edge weights, so the same tree is computed with Borůvka rounds:
+    every component picks its lightest outgoing edge at once, and the
+    union-find labels are merged by pointer jumping. All N mazes share one
+    flattened label array and need O(log(W * H)) rounds in total.
+    """
+    # Work through the batch in slices small enough to stay in cache
+    step = max(1, KRUSKAL_CHUNK_CELLS // masks[0].size)
+    for start in range(0, len(masks), step):
+        _boruvka(masks[start:start + step], rng)
+
+
+def _boruvka(masks, rng):
+    """Carve random minimum spanning trees into a slice of the batch."""
+    count, height, width = masks.shape
+    size = count * height * width
+    if width * height < 2:
+        return
+
+    # Distinct random weights per maze: random high bits, edge number in the
+    # low bits (labels never cross mazes, so weights only need to be unique
+    # within one maze)
+    edge_bits = int(2 * width * height).bit_length()
+    dtype = np.int32 if edge_bits <= 11 and size < 2 ** 31 else np.int64
+    random_bits = (31 if dtype is np.int32 else 62) - edge_bits
+    none = np.iinfo(dtype).max
+    local = np.arange(height * (width - 1), dtype=dtype).reshape(height, width - 1)
+    horizontal = rng.integers(0, 2 ** random_bits, (count, height, width - 1), dtype=dtype)
+    horizontal = horizontal << edge_bits | local
+    local = np.arange(local.size, local.size + (height - 1) * width,
+                      dtype=dtype).reshape(height - 1, width)
+    vertical = rng.integers(0, 2 ** random_bits, (count, height - 1, width), dtype=dtype)
+    vertical = vertical << edge_bits | local
+    open_east = np.zeros(horizontal.shape, dtype=bool)
+    open_north = np.zeros(vertical.shape, dtype=bool)
+
+    # Component labels are renumbered 0..components-1 after every round (in
+    # maze order), so the per-component tables shrink as components merge
+    label = np.arange(size, dtype=dtype).reshape(count, height, width)
+    maze_of = np.repeat(np.arange(count, dtype=dtype), width * height)
+    flat_label = label.reshape(count, -1)
+    edge_mask = (1 << edge_bits) - 1
+    east_edges = height * (width - 1)
+    components = size
+    while components > count:
+        # Weights of edges that still join two different components
+        east = np.where(label[:, :, :-1] != label[:, :, 1:], horizontal, none)
+        south = np.where(label[:, :-1, :] != label[:, 1:, :], vertical, none)
+        cell_best = np.full(label.shape, none, dtype=dtype)
+        cell_best[:, :, :-1] = east
+        np.minimum(cell_best[:, :, 1:], east, out=cell_best[:, :, 1:])
+        np.minimum(cell_best[:, :-1, :], south, out=cell_best[:, :-1, :])
+        np.minimum(cell_best[:, 1:, :], south, out=cell_best[:, 1:, :])
+
+        # Lightest outgoing edge of every component
+        if components == size:
+            best = cell_best.ravel()
+        else:
+            best = np.full(components, none, dtype=dtype)
+            pending = cell_best != none
+            np.minimum.at(best, label[pending], cell_best[pending])
+
+        # Decode each lightest edge into its two endpoint cells and open it
+        nodes = np.arange(components, dtype=dtype)
+        active = np.flatnonzero(best != none)
+        maze = maze_of[active]
+        edge = best[active] & edge_mask
+        is_east = edge < east_edges
+        vertical_edge = edge - east_edges
+        span = max(width - 1, 1)
+        first = np.where(is_east, edge // span * width + edge % span, vertical_edge)
+        second = first + np.where(is_east, 1, width)
+        open_east.reshape(count, -1)[maze[is_east], edge[is_east]] = True
+        open_north.reshape(count, -1)[maze[~is_east], vertical_edge[~is_east]] = True
+
+        # Hook each component onto the component across its lightest edge
+        near = flat_label[maze, first]
+        hook = nodes.copy()
+        hook[active] = np.where(near == active, flat_label[maze, second], near)
+        # Mutual picks form 2-cycles; the smaller label becomes the root
+        mutual = (hook[hook] == nodes) & (nodes < hook)
+        hook[mutual] = nodes[mutual]
+        while True:
+            jumped = hook[hook]
+            if np.array_equal(jumped, hook):
+                break
+            hook = jumped
+        roots = hook == nodes
+        renumber = (np.cumsum(roots, dtype=dtype) - 1)[hook]
+        label = renumber[label]
+        flat_label = label.reshape(count, -1)
+        maze_of = maze_of[roots]
+        components = len(maze_of)
+
+    _carve_east(masks, open_east)
+    _carve_north(masks, open_north)
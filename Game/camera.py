@@ -0,0 +1,218 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class Camera:
+    """
+    Viewport onto a world that can be larger than the window.
+
+    The camera follows a target with a dead zone: it only scrolls once the
+    target comes within ``margin`` of the view's edges, and it never shows
+    anything outside the world. Offsets are whole pixels so blits stay
+    aligned.
+    """
+
+    def __init__(self, view_width, view_height, world_width, world_height, margin=0.3):
+        """
+        Initialize the camera at the world's top-left corner.
+
+        Args:
+            view_width (int): Width of the viewport in pixels
+            view_height (int): Height of the viewport in pixels
+            world_width (int): Width of the world in pixels
+            world_height (int): Height of the world in pixels
+            margin (float): Fraction of the view, per side, the target may
+                enter before the camera scrolls
+        """
+        self.rect = pygame.Rect(0, 0, view_width, view_height)
+        self.world_width = world_width
+        self.world_height = world_height
+        self.margin = margin
+
+    def _clamp(self, x, y):
+        """Move the view to (x, y), kept inside the world."""
+        self.rect.x = max(0, min(x, self.world_width - self.rect.width))
+        self.rect.y = max(0, min(y, self.world_height - self.rect.height))
+
+    def center_on(self, pos):
+        """
+        Center the view on a world position.
+
+        Args:
+            pos (tuple): (x, y) world pixel position
+        """
+        self._clamp(int(pos[0]) - self.rect.width // 2, int(pos[1]) - self.rect.height // 2)
+
+    def follow(self, pos):
+        """
+        Scroll just enough to keep a world position out of the margins.
+
+        Args:
+            pos (tuple): (x, y) world pixel position of the target
+
+        Returns:
+            bool: True if the view moved
+        """
+        x, y = int(pos[0]), int(pos[1])
+        view = self.rect
+        margin_x = int(view.width * self.margin)
+        margin_y = int(view.height * self.margin)
+        left, top = view.topleft
+        if x < left + margin_x:
+            left = x - margin_x
+        elif x > view.right - margin_x:
+            left = x + margin_x - view.width
+        if y < top + margin_y:
+            top = y - margin_y
+        elif y > view.bottom - margin_y:
+            top = y + margin_y - view.height
+        previous = view.topleft
+        self._clamp(left, top)
+        return view.topleft != previous
+
+    def to_screen(self, rect):
+        """
+        Convert a world rectangle to screen coordinates.
+
+        Args:
+            rect (pygame.Rect): Area in world pixels
+
+        Returns:
+            pygame.Rect: The same area relative to the viewport
+        """
+        return pygame.Rect(rect).move(-self.rect.x, -self.rect.y)
+
+    def to_world(self, pos):
+        """
+        Convert a screen position (e.g. the mouse) to world coordinates.
+
+        Args:
+            pos (tuple): (x, y) screen pixel position
+
+        Returns:
+            tuple: (x, y) world pixel position
+        """
+        return pos[0] + self.rect.x, pos[1] + self.rect.y
+
+
+class ChunkCache:
+    """
+    Maze walls pre-rendered in square chunks of cells.
+
+    Only the chunks inside the camera's view are rendered and drawn; their
+    surfaces are kept in a least-recently-used cache, so memory depends on
+    the window size rather than the maze size. The cache empties itself
+    when the maze's ``version`` changes.
+    """
+
+    def __init__(self, maze, chunk_cells=8, max_chunks=48, color=(255, 255, 255)):
+        """
+        Initialize the cache.
+
+        Args:
+            maze (MazeGenerator): Maze to draw
+            chunk_cells (int): Width and height of a chunk in cells
+            max_chunks (int): Chunk surfaces kept before the least recently
+                drawn ones are evicted (raised if a single view needs more)
+            color (tuple): RGB color of the walls
+        """
+        self.maze = maze
+        self.chunk_cells = chunk_cells
+        self.max_chunks = max_chunks
+        self.color = color
+        self._chunks = OrderedDict()  # (cx, cy) -> surface
+        self._version = maze.version
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def _render_chunk(self, cx, cy):
+        """Draw the walls of one chunk on a new colorkeyed surface."""
+        maze, cells = self.maze, self.chunk_cells
+        pixels = cells * maze.cell_size
+        origin_x, origin_y = cx * pixels, cy * pixels
+        # Like MazeGenerator.render, the 2px wall lines may spill past the last cell
+        surface = pygame.Surface((pixels + 2, pixels + 2))
+        x0, y0 = cx * cells, cy * cells
+        for (x1, y1), (x2, y2) in maze.wall_segments(x0, y0, x0 + cells, y0 + cells):
+            pygame.draw.line(surface, self.color, (x1 - origin_x, y1 - origin_y),
+                             (x2 - origin_x, y2 - origin_y), 2)
+        surface.set_colorkey((0, 0, 0))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def visible(self, camera):
+        """
+        Return the chunks overlapping the camera's view.
+
+        Args:
+            camera (Camera): Current viewport
+
+        Returns:
+            list: (cx, cy) chunk coordinates
+        """
+        maze = self.maze
+        pixels = self.chunk_cells * maze.cell_size
+        last_x = (maze.width - 1) // self.chunk_cells
+        last_y = (maze.height - 1) // self.chunk_cells
+        view = camera.rect
+        # Lines spill 2px past a chunk, so the previous chunk can reach into view
+        x_range = range(max(0, (view.left - 2) // pixels), min(last_x, (view.right - 1) // pixels) + 1)
+        y_range = range(max(0, (view.top - 2) // pixels), min(last_y, (view.bottom - 1) // pixels) + 1)
+        return [(cx, cy) for cy in y_range for cx in x_range]
+
+    def _fetch(self, camera):
+        """Return the (key, surface) of every chunk in view, rendering misses."""
+        if self._version != self.maze.version:
+            self._chunks.clear()
+            self._version = self.maze.version
+        chunks = self._chunks
+        fetched = []
+        for key in self.visible(camera):
+            chunk = chunks.get(key)
+            if chunk is None:
+                chunk = chunks[key] = self._render_chunk(*key)
+            else:
+                chunks.move_to_end(key)
+            fetched.append((key, chunk))
+        # Never evict a chunk that is in view
+        limit = max(self.max_chunks, len(fetched))
+        while len(chunks) > limit:
+            chunks.popitem(last=False)
+        return fetched
+
+    def prepare(self, camera):
+        """
+        Render the chunks in view without drawing them, e.g. ahead of a level start.
+
+        Args:
+            camera (Camera): Viewport whose chunks should be cached
+        """
+        self._fetch(camera)
+
+    def blits(self, camera):
+        """
+        Return the chunks in view with their screen positions, rendering
+        chunks that are not cached.
+
+        Args:
+            camera (Camera): Current viewport
+
+        Returns:
+            list: (surface, (x, y)) pairs, ready for ``Surface.blits``
+        """
+        pixels = self.chunk_cells * self.maze.cell_size
+        return [(chunk, (cx * pixels - camera.rect.x, cy * pixels - camera.rect.y))
+                for (cx, cy), chunk in self._fetch(camera)]
+
+    def draw(self, surface, camera):
+        """
+        Draw the walls in view, rendering chunks that are not cached.
+
+        Args:
+            surface (pygame.Surface): Screen-sized surface to draw on
+            camera (Camera): Current viewport
+        """
+        surface.blits(self.blits(camera), doreturn=False)
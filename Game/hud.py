@@ -0,0 +1,135 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextRenderer:
+    """
+    Shared font and rendered-text cache.
+
+    Fonts are constructed once per (name, size). Rendered text surfaces are
+    cached by (text, size, color, name) with least-recently-used eviction.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of rendered surfaces kept
+        """
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+
+    def font(self, size, name=None):
+        """
+        Return the font for a size, loading it on first use.
+
+        Args:
+            size (int): Font size in points
+            name (str): Font file, or None for pygame's default font
+
+        Returns:
+            pygame.font.Font: The cached font
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, text, size, color, name=None):
+        """
+        Return an antialiased surface for the text, rendering it on a cache miss.
+
+        Args:
+            text (str): Text to render
+            size (int): Font size in points
+            color (tuple): RGB text color
+            name (str): Font file, or None for pygame's default font
+
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (text, size, color, name)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = self.font(size, name).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+class Hud:
+    """
+    Heads-up display made of named fields, one per line.
+
+    A field is only re-rendered when its value changes.
+    """
+
+    def __init__(self, text_renderer, fields, position=(10, 10), spacing=40,
+                 size=36, color=(255, 255, 255)):
+        """
+        Initialize the HUD.
+
+        Args:
+            text_renderer (TextRenderer): Cache used to render the lines
+            fields (list): (name, format) pairs, e.g. ("score", "Score: {}")
+            position (tuple): Top-left pixel position of the first line
+            spacing (int): Vertical distance between lines in pixels
+            size (int): Font size in points
+            color (tuple): RGB text color
+        """
+        self.text_renderer = text_renderer
+        self.fields = list(fields)
+        self._formats = dict(self.fields)
+        self.position = position
+        self.spacing = spacing
+        self.size = size
+        self.color = color
+        self._values = {}
+        self._lines = {}
+
+    def update(self, **values):
+        """
+        Set field values, re-rendering only the fields that changed.
+
+        Args:
+            **values: New value for each field name
+        """
+        for name, value in values.items():
+            if name in self._values and self._values[name] == value:
+                continue
+            self._values[name] = value
+            text = self._formats[name].format(value)
+            self._lines[name] = (text, self.text_renderer.render(text, self.size, self.color))
+
+    def sprites(self):
+        """
+        Return the HUD lines ready to draw.
+
+        Returns:
+            list: (text, surface, rect) for every field that has a value
+        """
+        x, y = self.position
+        sprites = []
+        for i, (name, _) in enumerate(self.fields):
+            line = self._lines.get(name)
+            if line is not None:
+                text, surface = line
+                sprites.append((text, surface, surface.get_rect(topleft=(x, y + self.spacing * i))))
+        return sprites
+
+    def draw(self, screen):
+        """
+        Draw the HUD on the given screen.
+
+        Args:
+            screen (pygame.Surface): Pygame surface to draw on
+        """
+        for _, surface, rect in self.sprites():
+            screen.blit(surface, rect)
@@ -0,0 +1,137 @@
+import mmap
+import os
+import struct
+
+from Game.maze_generator import MazeGenerator
+from Game.reachability import Reachability
+
+# magic, format version, width, height, seed, reachable cells, algorithm name
+_HEADER = struct.Struct("<4sBxxxIIQI16s")
+_MAGIC = b"CSLC"
+_VERSION = 1
+
+
+def _aligned(offset):
+    """Round an offset up to the next 4-byte boundary for the int32 arrays."""
+    return (offset + 3) & ~3
+
+
+class LevelCache:
+    """
+    Generated mazes stored on disk, keyed by (seed, width, height, algorithm).
+
+    Each file holds the packed wall masks followed by the reachability table
+    rooted at the top-left cell (``dist``, ``parent`` and ``order`` as int32
+    arrays). Loading maps the file copy-on-write and hands those regions to
+    the maze and its table without copying, so a level of a million cells
+    is ready as soon as the file is mapped. Arrays use the machine's byte
+    order: the cache is local, not an exchange format.
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize the cache.
+
+        Args:
+            directory (str): Folder holding the cache files (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, seed, width, height, algorithm):
+        """Return the file path for a key."""
+        return os.path.join(self.directory, f"{algorithm}-{width}x{height}-{seed}.level")
+
+    def load(self, seed, width, height, algorithm, cell_size=40):
+        """
+        Load a cached maze.
+
+        Args:
+            seed (int): Seed the maze was generated with
+            width (int): Width of the maze in cells
+            height (int): Height of the maze in cells
+            algorithm (str): Generation algorithm name
+            cell_size (int): Size of each cell in pixels
+
+        Returns:
+            MazeGenerator: The maze, with its reachability table from (0, 0)
+                already in place, or None if it is not cached
+        """
+        try:
+            with open(self.path(seed, width, height, algorithm), "rb") as f:
+                # ACCESS_COPY: the maze may edit its cells without touching the file
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, file_width, file_height, file_seed, reachable, name = \
+            _HEADER.unpack_from(data)
+        size = width * height
+        if (magic != _MAGIC or version != _VERSION or (file_width, file_height) != (width, height)
+                or file_seed != seed or name.rstrip(b"\0") != algorithm.encode()):
+            return None
+        # A truncated or padded file is a miss, not a bad cast
+        expected = _aligned(_HEADER.size + size) + 4 * (2 * size + reachable)
+        if reachable > size or len(data) != expected:
+            return None
+
+        view = memoryview(data)
+        cells = view[_HEADER.size:_HEADER.size + size]
+        offset = _aligned(_HEADER.size + size)
+        dist = view[offset:offset + 4 * size].cast("i")
+        offset += 4 * size
+        parent = view[offset:offset + 4 * size].cast("i")
+        offset += 4 * size
+        order = view[offset:offset + 4 * reachable].cast("i")
+
+        maze = MazeGenerator.from_cells(cells, width, height, cell_size, algorithm, seed, copy=False)
+        maze._reachability = Reachability(width, height, 0, dist, parent, order)
+        return maze
+
+    def store(self, maze):
+        """
+        Write a generated maze to the cache.
+
+        Args:
+            maze (MazeGenerator): Maze generated with a seed; the file is
+                written next to its final name and renamed, so a reader
+                never sees a partial file
+        """
+        if maze.seed is None:
+            raise ValueError("Only mazes generated with a seed can be cached")
+        table = maze.reachability((0, 0))
+        path = self.path(maze.seed, maze.width, maze.height, maze.algorithm)
+        header = _HEADER.pack(_MAGIC, _VERSION, maze.width, maze.height, maze.seed,
+                              len(table.order), maze.algorithm.encode()[:16])
+        padding = _aligned(len(header) + len(maze.cells)) - len(header) - len(maze.cells)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(header)
+            f.write(maze.cells)
+            f.write(bytes(padding))
+            for values in (table.dist, table.parent, table.order):
+                # array("i") or a mapped int32 memoryview: both write their raw bytes
+                f.write(values)
+        os.replace(temporary, path)
+
+    def get(self, seed, width, height, algorithm, cell_size=40):
+        """
+        Load a maze from the cache, generating and storing it on a miss.
+
+        Args:
+            seed (int): Seed to generate with
+            width (int): Width of the maze in cells
+            height (int): Height of the maze in cells
+            algorithm (str): Generation algorithm name
+            cell_size (int): Size of each cell in pixels
+
+        Returns:
+            MazeGenerator: The maze
+        """
+        maze = self.load(seed, width, height, algorithm, cell_size)
+        if maze is None:
+            maze = MazeGenerator(width, height, cell_size, seed)
+            maze.generate(algorithm)
+            self.store(maze)
+        return maze
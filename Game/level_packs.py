@@ -0,0 +1,206 @@
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Game.game import (
+    BASE_MAZE_SIZE, BASE_PATCHES, CELL_SIZE, LEVEL_ALGORITHMS, PATCH_SPACING,
+    PATCHES_PER_DIFFICULTY
+)
+from Game.maze_generator import MazeGenerator, ALL_WALLS
+from Game.maze_io import save_maze
+from Game.placement import place
+from Game.reachability import Reachability
+
+METRICS = ("dead_ends", "branching", "longest_path", "patch_distance")
+
+# Accepted metric ranges (inclusive), from the given difficulty up to the
+# next key. Metrics are normalized so the ranges hold as mazes grow:
+#   dead_ends       share of cells with a single exit
+#   branching       share of cells with three or more exits
+#   longest_path    share of cells on the longest path of the maze
+#   patch_distance  mean steps from the start to a patch, in maze widths
+DIFFICULTY_TARGETS = {
+    1: {"dead_ends": (0.0, 0.30), "patch_distance": (0.0, 2.2)},
+    4: {"dead_ends": (0.0, 0.32), "patch_distance": (1.8, 4.0)},
+    8: {"longest_path": (0.25, 1.0), "patch_distance": (2.5, math.inf)},
+}
+
+# Number of exits of a cell, by wall mask
+_EXITS = np.array([4 - bin(value & ALL_WALLS).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def targets_for(difficulty):
+    """
+    Return the metric ranges for a difficulty.
+
+    Args:
+        difficulty (int): Level difficulty (1 and up)
+
+    Returns:
+        dict: metric name -> (low, high)
+    """
+    tier = max((key for key in DIFFICULTY_TARGETS if key <= difficulty),
+               default=min(DIFFICULTY_TARGETS))
+    return DIFFICULTY_TARGETS[tier]
+
+
+def measure(mazes, difficulty):
+    """
+    Compute the metrics of mazes of the same size.
+
+    Exit counts are computed for the whole batch at once; the path metrics
+    need one breadth-first search from the start (the same reachability
+    the game places patches with) and one from the farthest cell.
+
+    Args:
+        mazes (list): MazeGenerator instances of equal width and height
+        difficulty (int): Difficulty the patches are placed for
+
+    Returns:
+        numpy.ndarray: ``(len(mazes), len(METRICS))`` float metrics
+    """
+    width, height = mazes[0].width, mazes[0].height
+    size = width * height
+    exits = _EXITS[np.frombuffer(b"".join(bytes(maze.cells) for maze in mazes),
+                                 dtype=np.uint8).reshape(len(mazes), size)]
+    metrics = np.empty((len(mazes), len(METRICS)))
+    metrics[:, 0] = (exits == 1).mean(axis=1)
+    metrics[:, 1] = (exits >= 3).mean(axis=1)
+    patch_count = BASE_PATCHES + difficulty * PATCHES_PER_DIFFICULTY
+    for i, maze in enumerate(mazes):
+        reachability = maze.reachability((0, 0))
+        dist = np.frombuffer(reachability.dist, dtype=np.int32)
+        # In a perfect maze the farthest cell from anywhere ends a longest path
+        farthest = Reachability.from_maze(maze, int(dist.argmax()))
+        metrics[i, 2] = (max(farthest.dist) + 1) / size
+        # Same draws as Game._spawn_entities for this seed
+        rng = random.Random(f"{maze.seed}:patches")
+        patches = place(maze, patch_count, rng, PATCH_SPACING)
+        metrics[i, 3] = dist[patches].mean() / width
+    return metrics
+
+
+def _accepts(metrics, targets):
+    """Boolean mask of the rows whose metrics are all within the targets."""
+    accepted = np.ones(len(metrics), dtype=bool)
+    for name, (low, high) in targets.items():
+        column = metrics[:, METRICS.index(name)]
+        accepted &= (column >= low) & (column <= high)
+    return accepted
+
+
+def _evaluate(candidates, side, difficulty, targets):
+    """
+    Worker: generate a batch of candidates and keep those on target.
+
+    Returns:
+        list: (seed, algorithm, metrics, cells) per candidate, cells being
+            None for rejected mazes so only accepted grids are sent back
+    """
+    mazes = []
+    for seed, algorithm in candidates:
+        maze = MazeGenerator(side, side, CELL_SIZE, seed)
+        maze.generate(algorithm)
+        mazes.append(maze)
+    metrics = measure(mazes, difficulty)
+    accepted = _accepts(metrics, targets)
+    return [(maze.seed, maze.algorithm, dict(zip(METRICS, row.tolist())),
+             bytes(maze.cells) if keep else None)
+            for maze, row, keep in zip(mazes, metrics, accepted)]
+
+
+def build_pack(directory, difficulty, count, seed=None, algorithms=LEVEL_ALGORITHMS,
+               targets=None, workers=None, batch=32, max_candidates=None, compression="zlib"):
+    """
+    Generate candidate levels on every core and save those that fit a difficulty.
+
+    Accepted levels are written as they arrive, one maze_io file each, and
+    listed with their seed and metrics in ``pack.jsonl``. Candidates are
+    numbered from ``seed`` and accepted in candidate order, so a seed always
+    gives the same pack whatever the number of workers.
+
+    Args:
+        directory (str): Output folder (created if needed)
+        difficulty (int): Difficulty of the pack; sets the maze size
+        count (int): Levels to accept
+        seed: Seed the candidate seeds are derived from (random if None)
+        algorithms (tuple): Generation algorithms, cycled over the candidates
+        targets (dict): metric name -> (low, high), defaults to
+            ``targets_for(difficulty)``
+        workers (int): Worker processes (defaults to the CPU count)
+        batch (int): Candidates generated and measured per task
+        max_candidates (int): Give up after this many candidates
+        compression (str): maze_io compression of the level files
+
+    Returns:
+        dict: "accepted", "candidates", "seconds", "workers", "per_second"
+            and "per_core" (candidates per second per worker)
+    """
+    targets = targets_for(difficulty) if targets is None else targets
+    unknown = set(targets) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metric(s) {', '.join(sorted(unknown))}. "
+                         f"Available: {', '.join(METRICS)}")
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    side = BASE_MAZE_SIZE + difficulty
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(directory, exist_ok=True)
+
+    def candidates(start):
+        end = start + batch if max_candidates is None else min(start + batch, max_candidates)
+        return [(random.Random(f"{seed}:{i}").getrandbits(32), algorithms[i % len(algorithms)])
+                for i in range(start, end)]
+
+    accepted = submitted = measured = 0
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(os.path.join(directory, "pack.jsonl"), "w") as index:
+        pending = deque()
+        while accepted < count:
+            # Keep every worker busy with a couple of batches queued
+            while len(pending) < workers * 2 and (max_candidates is None or
+                                                   submitted < max_candidates):
+                pending.append(pool.submit(_evaluate, candidates(submitted), side, difficulty,
+                                           targets))
+                submitted += batch
+            if not pending:
+                break
+            for level_seed, algorithm, metrics, cells in pending.popleft().result():
+                measured += 1
+                if cells is None or accepted >= count:
+                    continue
+                name = f"{accepted:04d}.maze"
+                save_maze(MazeGenerator.from_cells(cells, side, side, CELL_SIZE, algorithm,
+                                                   level_seed, copy=False),
+                          os.path.join(directory, name), compression)
+                index.write(json.dumps({"file": name, "seed": level_seed, "algorithm": algorithm,
+                                        "difficulty": difficulty, **metrics}) + "\n")
+                index.flush()
+                accepted += 1
+        for future in pending:
+            future.cancel()
+    elapsed = time.perf_counter() - start_time
+    return {
+        "accepted": accepted,
+        "candidates": measured,
+        "seconds": elapsed,
+        "workers": workers,
+        "per_second": measured / elapsed,
+        "per_core": measured / elapsed / workers,
+    }
+
+
+if __name__ == "__main__":
+    # python -m Game.level_packs <directory> <difficulty> <count> [seed]
+    directory, difficulty, count = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+    stats = build_pack(directory, difficulty, count, seed=sys.argv[4] if len(sys.argv) > 4 else None)
+    print(f"Accepted {stats['accepted']} of {stats['candidates']} candidates in "
+          f"{stats['seconds']:.2f}s: {stats['per_second']:.0f} mazes/s, "
+          f"{stats['per_core']:.0f} mazes/s per core ({stats['workers']} workers)")
@@ -0,0 +1,131 @@
+import queue
+import threading
+
+
+class Level:
+    """
+    Everything needed to start playing a level, built ahead of time.
+
+    Attributes:
+        number (int): Level number shown to the player
+        difficulty (int): Difficulty the level was generated for
+        maze (MazeGenerator): Generated maze, with its reachability table
+        patches (PatchIndex): Patches, in world pixels
+        chunks (ChunkCache): Wall chunks, pre-rendered around the start
+        distances (DistanceField): Distance from each cell to the nearest patch
+    """
+
+    def __init__(self, number, difficulty, maze, patches, chunks=None, distances=None):
+        self.number = number
+        self.difficulty = difficulty
+        self.maze = maze
+        self.patches = patches
+        self.chunks = chunks
+        self.distances = distances
+
+
+class LevelPipeline:
+    """
+    Build upcoming levels on a worker thread while the current one is played.
+
+    Levels are produced in order, starting from the level passed to
+    ``start``, each one a difficulty step above the previous. At most
+    ``depth`` finished levels wait in the queue; the worker then blocks
+    until one is taken. ``cancel`` stops the worker and drops its levels.
+    """
+
+    def __init__(self, build, depth=2):
+        """
+        Initialize an idle pipeline.
+
+        Args:
+            build (callable): ``build(number, difficulty)`` returning a Level;
+                called on the worker thread, so it must not touch game state
+            depth (int): Maximum number of finished levels kept waiting
+        """
+        self.build = build
+        self.depth = depth
+        self._levels = None
+        self._cancel = None
+        self._thread = None
+        self._expected = None  # (number, difficulty) of the next queued level
+
+    def start(self, number, difficulty):
+        """
+        Start producing levels from the given one onward.
+
+        Any running worker is cancelled first.
+
+        Args:
+            number (int): First level number to build
+            difficulty (int): Difficulty of that level
+        """
+        self.cancel()
+        self._levels = queue.Queue(maxsize=self.depth)
+        self._cancel = threading.Event()
+        self._expected = (number, difficulty)
+        self._thread = threading.Thread(
+            target=self._produce, args=(self._levels, self._cancel, number, difficulty),
+            name="level-pipeline", daemon=True)
+        self._thread.start()
+
+    def _produce(self, levels, cancel, number, difficulty):
+        """Worker loop: build levels in order until cancelled."""
+        while not cancel.is_set():
+            try:
+                level = self.build(number, difficulty)
+            except Exception as e:
+                # Re-raised on the game thread by take()
+                level = e
+            while not cancel.is_set():
+                try:
+                    levels.put(level, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if isinstance(level, Exception):
+                return
+            number += 1
+            difficulty += 1
+
+    def take(self, number, difficulty):
+        """
+        Hand over a pre-built level.
+
+        Waits if the worker is still building it.
+
+        Args:
+            number (int): Level number wanted
+            difficulty (int): Difficulty wanted
+
+        Returns:
+            Level: The level, or None if the pipeline is not producing it
+                (not started, or started for a different sequence)
+        """
+        if self._thread is None or self._expected != (number, difficulty):
+            return None
+        level = self._levels.get()
+        if isinstance(level, Exception):
+            self.cancel()
+            raise level
+        self._expected = (number + 1, difficulty + 1)
+        return level
+
+    def cancel(self, wait=False):
+        """
+        Stop the worker and discard the levels it built.
+
+        The worker notices between levels, so a level being built is
+        finished and then dropped.
+
+        Args:
+            wait (bool): Block until the worker has exited
+        """
+        if self._thread is None:
+            return
+        self._cancel.set()
+        if wait:
+            self._thread.join()
+        self._thread = None
+        self._levels = None
+        self._expected = None
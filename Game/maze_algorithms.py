@@ -0,0 +1,283 @@
+import random
+from array import array
+
+from Game.maze_generator import (
+    WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT, ALL_WALLS, VISITED
+)
+from Game.reachability import Reachability
+
+# Registry of maze generation algorithms, keyed by name
+ALGORITHMS = {}
+
+
+def register_algorithm(name):
+    """
+    Register a maze generation function under the given name.
+
+    The function is called as ``func(maze, rng)`` and must carve a perfect
+    maze into ``maze.cells`` (which starts out with every wall up). It may
+    return a Reachability table rooted at cell (0, 0) if it can build one
+    as a by-product; otherwise the maze computes it on demand.
+
+    Args:
+        name (str): Name used to select the algorithm
+
+    Returns:
+        function: Decorator that registers and returns the function
+    """
+    def decorator(func):
+        ALGORITHMS[name] = func
+        return func
+    return decorator
+
+
+def get_algorithm(name):
+    """
+    Look up a registered maze generation algorithm.
+
+    Args:
+        name (str): Registered algorithm name
+
+    Returns:
+        function: The generation function
+
+    Raises:
+        ValueError: If no algorithm is registered under that name
+    """
+    try:
+        return ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"Unknown maze algorithm '{name}'. "
+                         f"Available: {', '.join(sorted(ALGORITHMS))}") from None
+
+
+@register_algorithm("dfs")
+def generate_dfs(maze, rng=random):
+    """
+    Recursive backtracker (iterative depth-first search).
+
+    The carved passages are the DFS tree itself, so the tree's parent
+    pointers and depths are the maze's shortest paths from (0, 0).
+    """
+    cells = maze.cells
+    width = maze.width
+    size = width * maze.height
+    last_row = size - width
+    dist = array("i", [-1]) * size
+    parent = array("i", [-1]) * size
+    order = array("i", [0])
+    dist[0] = 0
+    cells[0] |= VISITED
+    stack = [0]
+    while stack:
+        i = stack[-1]
+        x = i % width
+        options = []
+        if i >= width and not cells[i - width] & VISITED:
+            options.append((i - width, WALL_TOP, WALL_BOTTOM))
+        if x + 1 < width and not cells[i + 1] & VISITED:
+            options.append((i + 1, WALL_RIGHT, WALL_LEFT))
+        if i < last_row and not cells[i + width] & VISITED:
+            options.append((i + width, WALL_BOTTOM, WALL_TOP))
+        if x > 0 and not cells[i - 1] & VISITED:
+            options.append((i - 1, WALL_LEFT, WALL_RIGHT))
+        if not options:
+            stack.pop()
+            continue
+        j, wall, opposite = options[0] if len(options) == 1 else rng.choice(options)
+        cells[i] &= ~wall
+        cells[j] = (cells[j] & ~opposite) | VISITED
+        dist[j] = dist[i] + 1
+        parent[j] = i
+        order.append(j)
+        stack.append(j)
+    return Reachability(width, maze.height, 0, dist, parent, order)
+
+
+@register_algorithm("kruskal")
+def generate_kruskal(maze, rng=random):
+    """Randomized Kruskal's algorithm over a union-find forest."""
+    cells = maze.cells
+    width, height = maze.width, maze.height
+    parent = list(range(width * height))
+
+    # Each edge is stored as the index of its top/left cell; even = right, odd = down
+    edges = [i * 2 for i in range(width * height) if (i + 1) % width]
+    edges += [i * 2 + 1 for i in range(width * (height - 1))]
+    rng.shuffle(edges)
+
+    remaining = width * height - 1
+    for edge in edges:
+        i = edge >> 1
+        j = i + width if edge & 1 else i + 1
+        # Find roots with path halving
+        a = i
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        b = j
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[b] = a
+        if edge & 1:
+            cells[i] &= ~WALL_BOTTOM
+            cells[j] &= ~WALL_TOP
+        else:
+            cells[i] &= ~WALL_RIGHT
+            cells[j] &= ~WALL_LEFT
+        remaining -= 1
+        if not remaining:
+            break
+
+
+def eller_rows(width, height, rng=random):
+    """
+    Stream a perfect maze one row at a time using Eller's algorithm.
+
+    Only the current row's set labels are kept, so memory is O(width)
+    regardless of height.
+
+    Args:
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        rng: Random source with ``random()`` (defaults to the random module)
+
+    Yields:
+        bytearray: Wall masks for each row, top to bottom
+    """
+    labels = list(range(width))
+    members = {label: [x] for x, label in enumerate(labels)}
+    next_label = width
+    top = bytearray([WALL_TOP]) * width  # WALL_TOP bits carried down from the previous row
+    for y in range(height):
+        row = bytearray([ALL_WALLS & ~WALL_TOP]) * width
+        for x in range(width):
+            row[x] |= top[x]
+        last = y == height - 1
+
+        # Join horizontally adjacent cells from different sets
+        for x in range(width - 1):
+            a, b = labels[x], labels[x + 1]
+            if a == b or not (last or rng.random() < 0.5):
+                continue
+            row[x] &= ~WALL_RIGHT
+            row[x + 1] &= ~WALL_LEFT
+            # Merge the smaller set into the larger one
+            if len(members[a]) < len(members[b]):
+                a, b = b, a
+            for column in members[b]:
+                labels[column] = a
+            members[a].extend(members.pop(b))
+
+        if last:
+            yield row
+            return
+
+        # Every set extends downwards at least once
+        top = bytearray([WALL_TOP]) * width
+        for columns in members.values():
+            down = [x for x in columns if rng.random() < 0.5]
+            if not down:
+                down = [columns[int(rng.random() * len(columns))]]
+            for x in down:
+                row[x] &= ~WALL_BOTTOM
+                top[x] = 0
+        yield row
+
+        # Cells without a passage from above start new sets
+        members = {}
+        for x in range(width):
+            if top[x]:
+                labels[x] = next_label
+                next_label += 1
+            members.setdefault(labels[x], []).append(x)
+
+
+@register_algorithm("eller")
+def generate_eller(maze, rng=random):
+    """Eller's algorithm, written row by row into the grid."""
+    width = maze.width
+    for y, row in enumerate(eller_rows(width, maze.height, rng)):
+        maze.cells[y * width:(y + 1) * width] = row
+
+
+@register_algorithm("wilson")
+def generate_wilson(maze, rng=random):
+    """Wilson's algorithm (loop-erased random walks, uniform spanning tree)."""
+    cells = maze.cells
+    width, height = maze.width, maze.height
+    size = width * height
+    up = (-width, WALL_TOP, WALL_BOTTOM)
+    right = (1, WALL_RIGHT, WALL_LEFT)
+    down = (width, WALL_BOTTOM, WALL_TOP)
+    left = (-1, WALL_LEFT, WALL_RIGHT)
+    in_tree = bytearray(size)
+    in_tree[rng.randrange(size)] = 1
+    # Last step taken out of each cell by the current walk (erases loops implicitly)
+    step = [None] * size
+    for start in range(size):
+        if in_tree[start]:
+            continue
+        i = start
+        while not in_tree[i]:
+            x = i % width
+            options = []
+            if i >= width:
+                options.append(up)
+            if x + 1 < width:
+                options.append(right)
+            if i + width < size:
+                options.append(down)
+            if x > 0:
+                options.append(left)
+            step[i] = rng.choice(options)
+            i += step[i][0]
+        # Carve the loop-erased path into the tree
+        i = start
+        while not in_tree[i]:
+            offset, wall, opposite = step[i]
+            cells[i] &= ~wall
+            cells[i + offset] &= ~opposite
+            in_tree[i] = 1
+            i += offset
+
+
+@register_algorithm("binary_tree")
+def generate_binary_tree(maze, rng=random):
+    """Binary tree: every cell opens either north or west."""
+    cells = maze.cells
+    width = maze.width
+    for i in range(1, width * maze.height):
+        x = i % width
+        if i < width or (x and rng.random() < 0.5):
+            cells[i] &= ~WALL_LEFT
+            cells[i - 1] &= ~WALL_RIGHT
+        else:
+            cells[i] &= ~WALL_TOP
+            cells[i - width] &= ~WALL_BOTTOM
+
+
+@register_algorithm("sidewinder")
+def generate_sidewinder(maze, rng=random):
+    """Sidewinder: carve horizontal runs, each opened upwards once."""
+    cells = maze.cells
+    width = maze.width
+    for y in range(maze.height):
+        row = y * width
+        run_start = 0
+        for x in range(width):
+            i = row + x
+            at_east = x + 1 == width
+            if y == 0 or (not at_east and rng.random() < 0.5):
+                if not at_east:
+                    cells[i] &= ~WALL_RIGHT
+                    cells[i + 1] &= ~WALL_LEFT
+                continue
+            # Close the run by opening one of its cells upwards
+            j = row + run_start + int(rng.random() * (x - run_start + 1))
+            cells[j] &= ~WALL_TOP
+            cells[j - width] &= ~WALL_BOTTOM
+            run_start = x + 1
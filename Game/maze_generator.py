@@ -3,9 +3,182 @@ import pygame
 import sys
 import random
 
+# Cell bit layout: one byte per cell, walls in the low nibble, visited above
+WALL_TOP = 0x01
+WALL_RIGHT = 0x02
+WALL_BOTTOM = 0x04
+WALL_LEFT = 0x08
+ALL_WALLS = WALL_TOP | WALL_RIGHT | WALL_BOTTOM | WALL_LEFT
+VISITED = 0x10
+
+# Wall bits in the same order as the legacy "walls" list: Top, Right, Bottom, Left
+WALL_BITS = (WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT)
+# (dx, dy) -> (wall bit on this cell, wall bit on the neighbor)
+DIRECTION_WALLS = {
+    (0, -1): (WALL_TOP, WALL_BOTTOM),
+    (1, 0): (WALL_RIGHT, WALL_LEFT),
+    (0, 1): (WALL_BOTTOM, WALL_TOP),
+    (-1, 0): (WALL_LEFT, WALL_RIGHT),
+}
+
+
+def neighbor_offsets(width):
+    """
+    Return the (wall bit, flat index offset) of each side of a cell.
+
+    The neighbor across a side is at ``index + offset`` and is reachable
+    when the cell's mask lacks the wall bit. Open sides are always
+    in-bounds: outer walls are never removed. Hot loops build the tuple
+    once per search and walk it inline.
+
+    Args:
+        width (int): Width of the maze in cells
+
+    Returns:
+        tuple: (wall bit, offset) pairs in WALL_BITS order
+    """
+    return ((WALL_TOP, -width), (WALL_RIGHT, 1), (WALL_BOTTOM, width), (WALL_LEFT, -1))
+
+
+# bytes.translate table setting VISITED on every cell, e.g. on generated mazes
+MARK_VISITED = bytes(value | VISITED for value in range(256))
+
+
+class _WallsView:
+    """List-like view over the four wall bits of one cell."""
+
+    __slots__ = ("_maze", "_index")
+
+    def __init__(self, maze, index):
+        self._maze = maze
+        self._index = index
+
+    def __getitem__(self, side):
+        return bool(self._maze.cells[self._index] & WALL_BITS[side])
+
+    def __setitem__(self, side, value):
+        if value:
+            self._maze.cells[self._index] |= WALL_BITS[side]
+        else:
+            self._maze.cells[self._index] &= ~WALL_BITS[side] & 0xFF
+        self._maze.invalidate()
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        mask = self._maze.cells[self._index]
+        return iter([bool(mask & bit) for bit in WALL_BITS])
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _CellView:
+    """Dict-like view exposing a cell as {"walls": [...], "visited": bool}."""
+
+    __slots__ = ("_maze", "_index")
+
+    def __init__(self, maze, index):
+        self._maze = maze
+        self._index = index
+
+    def __getitem__(self, key):
+        if key == "walls":
+            return _WallsView(self._maze, self._index)
+        if key == "visited":
+            return bool(self._maze.cells[self._index] & VISITED)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        cells = self._maze.cells
+        if key == "walls":
+            mask = 0
+            for bit, wall in zip(WALL_BITS, value):
+                if wall:
+                    mask |= bit
+            cells[self._index] = (cells[self._index] & ~ALL_WALLS & 0xFF) | mask
+        elif key == "visited":
+            if value:
+                cells[self._index] |= VISITED
+            else:
+                cells[self._index] &= ~VISITED & 0xFF
+        else:
+            raise KeyError(key)
+        self._maze.invalidate()
+
+    def keys(self):
+        return ("walls", "visited")
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        return {"walls": list(self["walls"]), "visited": self["visited"]} == other
+
+    def __repr__(self):
+        return repr({"walls": list(self["walls"]), "visited": self["visited"]})
+
+
+class _RowView:
+    """Row of cell views, indexable by x."""
+
+    __slots__ = ("_maze", "_offset", "_width")
+
+    def __init__(self, maze, offset, width):
+        self._maze = maze
+        self._offset = offset
+        self._width = width
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self._width
+        if not 0 <= x < self._width:
+            raise IndexError("cell index out of range")
+        return _CellView(self._maze, self._offset + x)
+
+    def __len__(self):
+        return self._width
+
+    def __iter__(self):
+        return (_CellView(self._maze, self._offset + x) for x in range(self._width))
+
+
+class GridView:
+    """
+    Compatibility view over the packed cell buffer.
+
+    ``grid[y][x]["walls"][side]`` and ``grid[y][x]["visited"]`` behave like
+    the old list-of-dicts grid (reads and writes go to the packed buffer).
+    Every write invalidates the maze's cached surface and reachability.
+    """
+
+    __slots__ = ("_maze", "_width", "_height")
+
+    def __init__(self, maze):
+        self._maze = maze
+        self._width = maze.width
+        self._height = maze.height
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self._height
+        if not 0 <= y < self._height:
+            raise IndexError("row index out of range")
+        return _RowView(self._maze, y * self._width, self._width)
+
+    def __len__(self):
+        return self._height
+
+    def __iter__(self):
+        return (self[y] for y in range(self._height))
+
 
 class MazeGenerator:
-    def __init__(self, width=15, height=15, cell_size=40):
+    def __init__(self, width=15, height=15, cell_size=40, seed=None):
         """
         Initialize a new maze generator.
 
@@ -13,34 +186,98 @@ class MazeGenerator:
             width (int): Width of the maze in cells
             height (int): Height of the maze in cells
             cell_size (int): Size of each cell in pixels
+            seed (int): Seed of the maze's own random generator; the same
+                seed, size and algorithm always give the same maze
         """
         self.width = width
         self.height = height
         self.cell_size = cell_size
-        self.grid = [[{"walls": [True, True, True, True], "visited": False}
-                      for _ in range(width)] for _ in range(height)]
+        self.algorithm = None
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # One byte per cell (row-major): wall bits plus the visited flag
+        self.cells = bytearray([ALL_WALLS]) * (width * height)
+        # Pre-rendered walls and the reachability table, rebuilt lazily
+        # after the maze changes
+        self._surface = None
+        self._reachability = None
+        self.version = 0
 
-    def generate(self):
+    @classmethod
+    def from_cells(cls, cells, width, height, cell_size=40, algorithm=None, seed=None,
+                   copy=True):
         """
-        Generate a maze using the depth-first search algorithm.
+        Build a maze around an existing packed cell buffer.
+
+        Args:
+            cells: Row-major wall masks, one byte per cell
+            width (int): Width of the maze in cells
+            height (int): Height of the maze in cells
+            cell_size (int): Size of each cell in pixels
+            algorithm (str): Name of the algorithm that produced the cells
+            seed (int): Seed the cells were generated with, if known
+            copy (bool): Copy the cells into a bytearray; pass False to use a
+                writable buffer (e.g. a memoryview of a mapped file) as is
+
+        Returns:
+            MazeGenerator: The maze
+        """
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+        maze = cls(0, 0, cell_size, seed)
+        maze.width = width
+        maze.height = height
+        maze.algorithm = algorithm
+        maze.cells = bytearray(cells) if copy else cells
+        return maze
+
+    @property
+    def grid(self):
+        """Legacy ``grid[y][x]`` dict-shaped view over ``cells``."""
+        return GridView(self)
+
+    def index(self, x, y):
+        """Return the flat ``cells`` index of cell (x, y)."""
+        return y * self.width + x
+
+    def has_wall(self, x, y, dx, dy):
+        """
+        Check whether cell (x, y) has a wall on the side facing (dx, dy).
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+            dx (int): Horizontal step (-1, 0 or 1)
+            dy (int): Vertical step (-1, 0 or 1)
+
+        Returns:
+            bool: True if the side is walled (or the step is not a unit step)
+        """
+        walls = DIRECTION_WALLS.get((dx, dy))
+        if walls is None:
+            return True
+        return bool(self.cells[y * self.width + x] & walls[0])
+
+    def generate(self, algorithm="dfs"):
+        """
+        Generate a maze with the named algorithm (depth-first search by default).
         Returns the generated grid.
+
+        Args:
+            algorithm (str): Name of a registered algorithm, see
+                ``Game.maze_algorithms.ALGORITHMS``
         """
-        stack = []
-        current = (0, 0)
-        self.grid[0][0]["visited"] = True
-
-        while True:
-            neighbors = self.get_unvisited_neighbors(*current)
-            if neighbors:
-                next_cell = random.choice(neighbors)
-                stack.append(current)
-                self.remove_walls(current, next_cell)
-                current = next_cell
-                self.grid[current[1]][current[0]]["visited"] = True
-            elif stack:
-                current = stack.pop()
-            else:
-                return self.grid
+        # Import here to avoid circular imports
+        from Game.maze_algorithms import get_algorithm
+
+        generate = get_algorithm(algorithm)
+        self.algorithm = algorithm
+        reachability = generate(self, self.rng)
+        # Every cell of a perfect maze ends up visited
+        self.cells[:] = self.cells.translate(MARK_VISITED)
+        self.invalidate()
+        self._reachability = reachability
+        return self.grid
 
     def get_unvisited_neighbors(self, x, y):
         """
@@ -53,15 +290,18 @@ class MazeGenerator:
         Returns:
             list: List of (x, y) tuples representing unvisited neighbors
         """
-        directions = [
-            (x, y - 1),  # Top
-            (x + 1, y),  # Right
-            (x, y + 1),  # Bottom
-            (x - 1, y)  # Left
-        ]
-        return [(nx, ny) for nx, ny in directions
-                if 0 <= nx < self.width and 0 <= ny < self.height
-                and not self.grid[ny][nx]["visited"]]
+        cells = self.cells
+        width = self.width
+        neighbors = []
+        if y > 0 and not cells[(y - 1) * width + x] & VISITED:  # Top
+            neighbors.append((x, y - 1))
+        if x + 1 < width and not cells[y * width + x + 1] & VISITED:  # Right
+            neighbors.append((x + 1, y))
+        if y + 1 < self.height and not cells[(y + 1) * width + x] & VISITED:  # Bottom
+            neighbors.append((x, y + 1))
+        if x > 0 and not cells[y * width + x - 1] & VISITED:  # Left
+            neighbors.append((x - 1, y))
+        return neighbors
 
     def remove_walls(self, current, next_cell):
         """
@@ -73,20 +313,124 @@ class MazeGenerator:
         """
         x1, y1 = current
         x2, y2 = next_cell
-        dx, dy = x2 - x1, y2 - y1
-
-        if dx == 1:  # Right
-            self.grid[y1][x1]["walls"][1] = False
-            self.grid[y2][x2]["walls"][3] = False
-        elif dx == -1:  # Left
-            self.grid[y1][x1]["walls"][3] = False
-            self.grid[y2][x2]["walls"][1] = False
-        elif dy == 1:  # Down
-            self.grid[y1][x1]["walls"][2] = False
-            self.grid[y2][x2]["walls"][0] = False
-        elif dy == -1:  # Up
-            self.grid[y1][x1]["walls"][0] = False
-            self.grid[y2][x2]["walls"][2] = False
+        walls = DIRECTION_WALLS.get((x2 - x1, y2 - y1))
+        if walls is None:
+            return
+        self.cells[y1 * self.width + x1] &= ~walls[0] & 0xFF
+        self.cells[y2 * self.width + x2] &= ~walls[1] & 0xFF
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drop the cached wall surface and reachability table.
+
+        Call after editing ``cells`` directly; writes through ``grid`` call
+        it themselves.
+        ``version`` is bumped so other caches of the walls can notice.
+        """
+        self._surface = None
+        self._reachability = None
+        self.version += 1
+
+    def reachability(self, start=(0, 0)):
+        """
+        Return the connectivity/distance table rooted at a start cell.
+
+        The table built during generation is reused when it has the same
+        root; otherwise (or after an edit) it is computed with an
+        array-based BFS and cached.
+
+        Args:
+            start (tuple): (x, y) of the root cell
+
+        Returns:
+            Reachability: Distances and parent pointers from ``start``
+        """
+        # Import here to avoid circular imports
+        from Game.reachability import Reachability
+
+        index = start[1] * self.width + start[0]
+        if self._reachability is None or self._reachability.start != index:
+            self._reachability = Reachability.from_maze(self, index)
+        return self._reachability
+
+    def wall_segments(self, x0=0, y0=0, x1=None, y1=None):
+        """
+        Collect the maze walls as merged line segments.
+
+        Collinear runs of walls are fused into a single segment, so a long
+        corridor wall is one line instead of one line per cell.
+
+        Args:
+            x0 (int): First column of the region to collect
+            y0 (int): First row of the region to collect
+            x1 (int): Column after the region (defaults to the maze width)
+            y1 (int): Row after the region (defaults to the maze height)
+
+        Returns:
+            list: ((x1, y1), (x2, y2)) pixel coordinates of each segment
+        """
+        cells = self.cells
+        width, height, size = self.width, self.height, self.cell_size
+        x1 = width if x1 is None else min(x1, width)
+        y1 = height if y1 is None else min(y1, height)
+        segments = []
+
+        # Horizontal grid lines: the top walls of row y (bottom walls of the last row)
+        for y in range(y0, y1 + 1):
+            if y < height:
+                row, bit = y * width, WALL_TOP
+            else:
+                row, bit = (height - 1) * width, WALL_BOTTOM
+            start = None
+            for x in range(x0, x1 + 1):
+                wall = x < x1 and cells[row + x] & bit
+                if wall and start is None:
+                    start = x
+                elif not wall and start is not None:
+                    segments.append(((start * size, y * size), (x * size, y * size)))
+                    start = None
+
+        # Vertical grid lines: the left walls of column x (right walls of the last column)
+        for x in range(x0, x1 + 1):
+            if x < width:
+                column, bit = x, WALL_LEFT
+            else:
+                column, bit = width - 1, WALL_RIGHT
+            start = None
+            for y in range(y0, y1 + 1):
+                wall = y < y1 and cells[y * width + column] & bit
+                if wall and start is None:
+                    start = y
+                elif not wall and start is not None:
+                    segments.append(((x * size, start * size), (x * size, y * size)))
+                    start = None
+        return segments
+
+    def render(self, color=(255, 255, 255)):
+        """
+        Return a surface with the maze walls drawn on it.
+
+        The surface is built once from the merged wall segments and cached
+        until the maze changes. Black is the colorkey, so only walls show
+        when it is blitted.
+
+        Args:
+            color (tuple): RGB color of the walls
+
+        Returns:
+            pygame.Surface: The cached wall surface
+        """
+        if self._surface is None:
+            surface = pygame.Surface((self.width * self.cell_size + 2,
+                                      self.height * self.cell_size + 2))
+            for start, end in self.wall_segments():
+                pygame.draw.line(surface, color, start, end, 2)
+            surface.set_colorkey((0, 0, 0))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self._surface = surface
+        return self._surface
 
     def draw(self, screen):
         """
@@ -95,29 +439,7 @@ class MazeGenerator:
         Args:
             screen (pygame.Surface): Pygame surface to draw on
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.grid[y][x]
-                # Calculate pixel coordinates
-                px, py = x * self.cell_size, y * self.cell_size
-
-                # Draw walls
-                if cell["walls"][0]:  # Top
-                    pygame.draw.line(screen, (255, 255, 255),
-                                     (px, py),
-                                     (px + self.cell_size, py), 2)
-                if cell["walls"][1]:  # Right
-                    pygame.draw.line(screen, (255, 255, 255),
-                                     (px + self.cell_size, py),
-                                     (px + self.cell_size, py + self.cell_size), 2)
-                if cell["walls"][2]:  # Bottom
-                    pygame.draw.line(screen, (255, 255, 255),
-                                     (px, py + self.cell_size),
-                                     (px + self.cell_size, py + self.cell_size), 2)
-                if cell["walls"][3]:  # Left
-                    pygame.draw.line(screen, (255, 255, 255),
-                                     (px, py),
-                                     (px, py + self.cell_size), 2)
+        screen.blit(self.render(), (0, 0))
 
 
 if __name__ == "__main__":
@@ -145,4 +467,4 @@ if __name__ == "__main__":
         clock.tick(60)
 
     pygame.quit()
-    sys.exit()
\ No newline at end of file
+    sys.exit()
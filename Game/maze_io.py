@@ -0,0 +1,277 @@
+import re
+import struct
+import zlib
+
+from Game.maze_generator import MazeGenerator, ALL_WALLS, MARK_VISITED
+
+# File layout: header, then one record per row of 4-bit wall masks (two
+# cells per byte, the even column in the low nibble), compressed as a whole
+# (zlib) or row by row (rle)
+MAGIC = b"CSMZ"
+FORMAT_VERSION = 1
+
+COMPRESS_NONE = 0
+COMPRESS_RLE = 1
+COMPRESS_ZLIB = 2
+COMPRESSIONS = {"none": COMPRESS_NONE, "rle": COMPRESS_RLE, "zlib": COMPRESS_ZLIB}
+
+# magic, version, compression, flags, width, height, seed, algorithm name
+_HEADER = struct.Struct("<4sBBHIIQ16s")
+_FLAG_SEED = 0x01
+
+_LOW = bytes(value & ALL_WALLS for value in range(256))
+_HIGH = bytes(value >> 4 for value in range(256))
+_SHIFT = bytes((value & ALL_WALLS) << 4 for value in range(256))
+# Runs of one repeated byte, matched in C rather than byte by byte
+_RUNS = re.compile(rb"(.)\1*", re.DOTALL)
+_READ_SIZE = 1 << 16
+
+
+class MazeFormatError(ValueError):
+    """Raised when a maze file is malformed or uses an unknown version."""
+
+
+def pack_row(row):
+    """
+    Pack wall masks two per byte.
+
+    Args:
+        row: Wall masks of one row (the visited bit and above are dropped)
+
+    Returns:
+        bytes: ``ceil(len(row) / 2)`` bytes
+    """
+    size = (len(row) + 1) // 2
+    low = bytes(row[0::2]).translate(_LOW)
+    high = bytes(row[1::2]).translate(_SHIFT).ljust(size, b"\0")
+    # One bitwise OR over the whole row instead of a loop per byte
+    return (int.from_bytes(low, "little") | int.from_bytes(high, "little")).to_bytes(size, "little")
+
+
+def unpack_row(packed, width):
+    """
+    Expand a packed row back to one wall mask per byte.
+
+    Args:
+        packed (bytes): Row written by ``pack_row``
+        width (int): Number of cells in the row
+
+    Returns:
+        bytearray: ``width`` wall masks
+    """
+    row = bytearray(len(packed) * 2)
+    row[0::2] = packed.translate(_LOW)
+    row[1::2] = packed.translate(_HIGH)
+    del row[width:]
+    return row
+
+
+def _rle_encode(data):
+    """Encode bytes as (count, value) pairs, runs capped at 255."""
+    out = bytearray()
+    for match in _RUNS.finditer(data):
+        value = match.group(1)[0]
+        count = match.end() - match.start()
+        while count > 255:
+            out += bytes((255, value))
+            count -= 255
+        out += bytes((count, value))
+    return bytes(out)
+
+
+class MazeWriter:
+    """
+    Write a maze to a binary stream one row at a time.
+
+    Only the current row is held in memory, so mazes can be saved while
+    they are generated (e.g. from ``eller_rows``). Use as a context manager
+    or call ``close`` once every row has been written.
+    """
+
+    def __init__(self, file, width, height, seed=None, algorithm=None, compression="zlib"):
+        """
+        Write the header.
+
+        Args:
+            file: Binary file object to write to (not closed by the writer)
+            width (int): Width of the maze in cells
+            height (int): Height of the maze in cells
+            seed (int): Seed the maze was generated with, if any
+            algorithm (str): Generation algorithm name (up to 16 bytes)
+            compression (str): "none", "rle" or "zlib"
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}'")
+        self.file = file
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self._mode = COMPRESSIONS[compression]
+        self._zlib = zlib.compressobj() if self._mode == COMPRESS_ZLIB else None
+        file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, self._mode,
+                                _FLAG_SEED if seed is not None else 0,
+                                width, height, seed or 0, (algorithm or "").encode()[:16]))
+
+    def write_row(self, row):
+        """
+        Append the next row.
+
+        Args:
+            row: ``width`` wall masks, one per byte
+        """
+        if len(row) != self.width:
+            raise ValueError(f"Expected {self.width} cells, got {len(row)}")
+        if self.rows_written >= self.height:
+            raise ValueError("All rows have already been written")
+        packed = pack_row(row)
+        if self._mode == COMPRESS_ZLIB:
+            self.file.write(self._zlib.compress(packed))
+        elif self._mode == COMPRESS_RLE:
+            encoded = _rle_encode(packed)
+            self.file.write(struct.pack("<I", len(encoded)))
+            self.file.write(encoded)
+        else:
+            self.file.write(packed)
+        self.rows_written += 1
+
+    def close(self):
+        """Flush the compressor and check that every row was written."""
+        if self._zlib is not None:
+            self.file.write(self._zlib.flush())
+            self._zlib = None
+        if self.rows_written != self.height:
+            raise ValueError(f"Wrote {self.rows_written} of {self.height} rows")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Don't mask the original error with a row-count complaint
+        if exc_type is None:
+            self.close()
+
+
+class MazeReader:
+    """
+    Read a maze written by MazeWriter one row at a time.
+
+    The header is parsed on construction; ``rows`` then decodes the body
+    lazily, holding at most one read buffer and one row.
+
+    Attributes:
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        seed (int): Seed recorded in the file, or None
+        algorithm (str): Algorithm recorded in the file, or None
+        compression (str): "none", "rle" or "zlib"
+    """
+
+    def __init__(self, file):
+        """
+        Read and validate the header.
+
+        Args:
+            file: Binary file object positioned at the start of a maze
+        """
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise MazeFormatError("Truncated header")
+        magic, version, mode, flags, width, height, seed, algorithm = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise MazeFormatError("Not a maze file")
+        if version != FORMAT_VERSION:
+            raise MazeFormatError(f"Unsupported format version {version}")
+        names = {value: name for name, value in COMPRESSIONS.items()}
+        if mode not in names:
+            raise MazeFormatError(f"Unknown compression {mode}")
+        self.file = file
+        self.width = width
+        self.height = height
+        self.seed = seed if flags & _FLAG_SEED else None
+        self.algorithm = algorithm.rstrip(b"\0").decode() or None
+        self.compression = names[mode]
+        self._mode = mode
+
+    def _read(self, size):
+        """Read exactly ``size`` bytes."""
+        data = self.file.read(size)
+        if len(data) != size:
+            raise MazeFormatError("Truncated maze data")
+        return data
+
+    def _packed_rows(self):
+        """Yield each row's packed bytes."""
+        size = (self.width + 1) // 2
+        if self._mode == COMPRESS_NONE:
+            for _ in range(self.height):
+                yield self._read(size)
+        elif self._mode == COMPRESS_RLE:
+            for _ in range(self.height):
+                encoded = self._read(struct.unpack("<I", self._read(4))[0])
+                row = b"".join(bytes((encoded[i + 1],)) * encoded[i]
+                               for i in range(0, len(encoded), 2))
+                if len(row) != size:
+                    raise MazeFormatError("Corrupt run-length row")
+                yield row
+        else:
+            decompressor = zlib.decompressobj()
+            buffer = bytearray()
+            for _ in range(self.height):
+                while len(buffer) < size:
+                    chunk = self.file.read(_READ_SIZE)
+                    if not chunk:
+                        buffer += decompressor.flush()
+                        if len(buffer) < size:
+                            raise MazeFormatError("Truncated maze data")
+                        break
+                    buffer += decompressor.decompress(chunk)
+                yield bytes(buffer[:size])
+                del buffer[:size]
+
+    def rows(self):
+        """
+        Decode the maze row by row.
+
+        Yields:
+            bytearray: ``width`` wall masks for each row, top to bottom
+        """
+        width = self.width
+        for packed in self._packed_rows():
+            yield unpack_row(packed, width)
+
+
+def save_maze(maze, path, compression="zlib"):
+    """
+    Save a maze to a file.
+
+    Args:
+        maze (MazeGenerator): Maze to save
+        path (str): Destination file
+        compression (str): "none", "rle" or "zlib"
+    """
+    width = maze.width
+    with open(path, "wb") as f, MazeWriter(f, width, maze.height, maze.seed, maze.algorithm,
+                                          compression) as writer:
+        for y in range(maze.height):
+            writer.write_row(maze.cells[y * width:(y + 1) * width])
+
+
+def load_maze(path, cell_size=40):
+    """
+    Load a maze saved with ``save_maze`` or ``MazeWriter``.
+
+    Args:
+        path (str): File to read
+        cell_size (int): Size of each cell in pixels
+
+    Returns:
+        MazeGenerator: The maze, every cell marked visited
+    """
+    with open(path, "rb") as f:
+        reader = MazeReader(f)
+        cells = bytearray()
+        for row in reader.rows():
+            cells += row
+    cells[:] = cells.translate(MARK_VISITED)
+    return MazeGenerator.from_cells(cells, reader.width, reader.height, cell_size,
+                                    reader.algorithm, reader.seed, copy=False)
@@ -0,0 +1,139 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from Game.maze_generator import (
+    MazeGenerator, WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT, MARK_VISITED
+)
+from Game.maze_algorithms import get_algorithm
+
+# Default tile side in cells: large enough that per-task overhead is noise,
+# small enough that a 10000x10000 maze splits into ~100 tasks to balance
+DEFAULT_TILE = 1024
+
+
+def _tile_seed(seed, tx, ty):
+    """Seed of one tile, independent of how tiles are spread over workers."""
+    return random.Random(f"{seed}:tile:{tx}:{ty}").getrandbits(64)
+
+
+def _generate_tile(name, width, x0, y0, tile_w, tile_h, algorithm, seed):
+    """
+    Worker: carve one tile and write it into the shared cell buffer.
+
+    Only the tile's own cells are written, so tiles never overlap and no
+    locking is needed. Nothing but the arguments crosses the process
+    boundary; the cells go straight into shared memory.
+    """
+    tile = MazeGenerator(tile_w, tile_h, seed=seed)
+    get_algorithm(algorithm)(tile, tile.rng)
+    cells = tile.cells.translate(MARK_VISITED)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buf = shm.buf
+        for y in range(tile_h):
+            start = (y0 + y) * width + x0
+            buf[start:start + tile_w] = cells[y * tile_w:(y + 1) * tile_w]
+        del buf
+    finally:
+        shm.close()
+
+
+def _tiles(width, height, tile):
+    """Yield (tx, ty, x0, y0, tile width, tile height) covering the grid."""
+    for ty, y0 in enumerate(range(0, height, tile)):
+        for tx, x0 in enumerate(range(0, width, tile)):
+            yield tx, ty, x0, y0, min(tile, width - x0), min(tile, height - y0)
+
+
+def _stitch(buf, width, height, tile, rng):
+    """
+    Join the tiles with one passage per edge of a random spanning tree.
+
+    Each tile is already a perfect maze (a spanning tree of its cells), so
+    opening exactly one wall along each edge of a spanning tree over the
+    tiles gives a spanning tree of the whole grid: a single perfect maze.
+    """
+    columns = -(-width // tile)
+    rows = -(-height // tile)
+    parent = list(range(columns * rows))
+    # Tile edges as (tile, right neighbor?) pairs in random order (Kruskal)
+    edges = [(ty * columns + tx, True) for ty in range(rows) for tx in range(columns - 1)]
+    edges += [(ty * columns + tx, False) for ty in range(rows - 1) for tx in range(columns)]
+    rng.shuffle(edges)
+    for t, east in edges:
+        u = t + 1 if east else t + columns
+        a = t
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        b = u
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[b] = a
+        tx, ty = t % columns, t // columns
+        if east:
+            # Door at a random row of the shared vertical border
+            x = tx * tile + tile - 1
+            y = ty * tile + rng.randrange(min(tile, height - ty * tile))
+            buf[y * width + x] &= ~WALL_RIGHT
+            buf[y * width + x + 1] &= ~WALL_LEFT
+        else:
+            x = tx * tile + rng.randrange(min(tile, width - tx * tile))
+            y = ty * tile + tile - 1
+            buf[y * width + x] &= ~WALL_BOTTOM
+            buf[(y + 1) * width + x] &= ~WALL_TOP
+
+
+def generate_parallel(width, height, algorithm="dfs", seed=None, tile=DEFAULT_TILE,
+                      workers=None, cell_size=40):
+    """
+    Generate a very large perfect maze on every core.
+
+    The grid is split into ``tile`` x ``tile`` tiles, each carved as a
+    perfect maze by a ProcessPoolExecutor worker directly into one
+    shared-memory cell buffer; the tiles are then joined along a random
+    spanning tree. The same seed, size, algorithm and tile size always give
+    the same maze, whatever the number of workers. The tile borders stay
+    visible in the layout: two neighboring tiles share at most one door.
+
+    Args:
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        algorithm (str): Registered algorithm used inside each tile, see
+            ``Game.maze_algorithms.ALGORITHMS``
+        seed (int): Seed for the tiles and the join; random if None
+        tile (int): Side of a tile in cells
+        workers (int): Worker processes (defaults to the CPU count)
+        cell_size (int): Size of each cell in pixels
+
+    Returns:
+        MazeGenerator: The maze, every cell marked visited
+    """
+    get_algorithm(algorithm)  # Fail before starting any process
+    if tile < 1:
+        raise ValueError("Tile size must be at least 1")
+    base = seed if seed is not None else random.getrandbits(64)
+    size = width * height
+    tiles = list(_tiles(width, height, tile))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+    try:
+        workers = min(workers or os.cpu_count() or 1, max(1, len(tiles)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_generate_tile, shm.name, width, x0, y0, tile_w, tile_h,
+                                   algorithm, _tile_seed(base, tx, ty))
+                       for tx, ty, x0, y0, tile_w, tile_h in tiles]
+            for future in futures:
+                future.result()
+        with shm.buf[:size] as buf:
+            _stitch(buf, width, height, tile, random.Random(f"{base}:stitch"))
+            cells = bytearray(buf)
+    finally:
+        shm.close()
+        shm.unlink()
+    return MazeGenerator.from_cells(cells, width, height, cell_size, f"tiled-{algorithm}",
+                                    seed, copy=False)
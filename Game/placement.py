@@ -0,0 +1,114 @@
+from array import array
+
+from Game.maze_generator import neighbor_offsets
+
+
+def _uniform_order(order, rng):
+    """
+    Yield reachable cells in random order, each at most once.
+
+    A lazy Fisher-Yates shuffle over a copy of the discovery order: only
+    the cells actually drawn cost any Python work.
+    """
+    pool = array("i", order)
+    for end in range(len(pool) - 1, -1, -1):
+        pick = rng.randrange(end + 1)
+        cell = pool[pick]
+        pool[pick] = pool[end]
+        yield cell
+
+
+def _weighted_order(reachability, rng, distance_bias, count):
+    """
+    Yield every reachable cell in weighted random order.
+
+    Weighted sampling without replacement (Efraimidis-Spirakis): each cell
+    gets the key log(u) / weight and cells are taken by decreasing key,
+    with weight (distance from the start + 1) ** distance_bias. Only the
+    best few keys are sorted up front; the rest only if spacing rejects
+    enough of them.
+    """
+    # Import here so uniform placement works without numpy installed
+    import numpy as np
+
+    order = np.frombuffer(reachability.order, dtype=np.int32)
+    dist = np.frombuffer(reachability.dist, dtype=np.int32)[order]
+    weights = (dist + 1.0) ** distance_bias
+    uniform = np.random.default_rng(rng.getrandbits(64)).random(len(order))
+    keys = -np.log(uniform) / weights  # Smallest first
+    head = min(len(order), max(64, count * 8))
+    split = np.argpartition(keys, head - 1)
+    for part in (split[:head], split[head:]):
+        yield from order[part[np.argsort(keys[part], kind="stable")]].tolist()
+
+
+def _block_around(maze, cell, spacing, near):
+    """
+    Record the path distance to a new patch for every cell closer than
+    ``spacing``, keeping the smaller value in ``near``.
+
+    The search stops where a cell is already as close to an earlier patch,
+    so overlapping neighborhoods are not walked twice.
+    """
+    cells, sides = maze.cells, neighbor_offsets(maze.width)
+    near[cell] = 0
+    frontier = [cell]
+    for step in range(1, spacing):
+        reached = []
+        for index in frontier:
+            mask = cells[index]
+            for wall, offset in sides:
+                if not mask & wall:
+                    neighbor = index + offset
+                    if near[neighbor] > step:
+                        near[neighbor] = step
+                        reached.append(neighbor)
+        frontier = reached
+
+
+def place(maze, count, rng, spacing=0, distance_bias=0.0, start=(0, 0)):
+    """
+    Pick distinct cells reachable from the start, e.g. for patches.
+
+    Cells are drawn without replacement, uniformly or weighted by their
+    distance from the start. With ``spacing``, a cell is skipped while it
+    is fewer than ``spacing`` steps (along the maze) from an earlier pick;
+    if that leaves too few cells, the skipped ones are used in the order
+    they were drawn. Runs in O(cells drawn + cells within ``spacing`` of
+    a pick), plus a sort of the reachable cells when weighted.
+
+    Args:
+        maze (MazeGenerator): Maze to place in
+        count (int): Number of cells to pick
+        rng (random.Random): Random source
+        spacing (int): Minimum steps between picks (0 or 1 for none)
+        distance_bias (float): 0 for uniform; > 0 favors cells far from
+            the start, < 0 cells close to it
+        start (tuple): (x, y) cell the reachable set is computed from
+
+    Returns:
+        list: Flat cell indices (y * width + x), at most the number of
+            reachable cells
+    """
+    reachability = maze.reachability(start)
+    if count <= 0 or not reachability.order:
+        return []
+    if distance_bias:
+        candidates = _weighted_order(reachability, rng, distance_bias, count)
+    else:
+        candidates = _uniform_order(reachability.order, rng)
+    if spacing <= 1:
+        return [cell for cell, _ in zip(candidates, range(count))]
+
+    near = array("i", [spacing]) * (maze.width * maze.height)
+    picked = []
+    skipped = []
+    for cell in candidates:
+        if near[cell] < spacing:
+            skipped.append(cell)
+            continue
+        picked.append(cell)
+        if len(picked) == count:
+            return picked
+        _block_around(maze, cell, spacing, near)
+    return picked + skipped[:count - len(picked)]
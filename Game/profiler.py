@@ -0,0 +1,182 @@
+import csv
+import json
+import time
+from collections import deque
+
+# Sections in the order they run within a frame, shown in this order
+SECTIONS = ("input", "movement", "collisions", "maze", "entities", "hud", "flip", "frame")
+
+
+class _Section:
+    """Context manager timing one named section into its profiler."""
+
+    __slots__ = ("samples", "_start")
+
+    def __init__(self, samples):
+        self.samples = samples
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.samples.append(time.perf_counter_ns() - self._start)
+
+
+class _NullSection:
+    """Shared do-nothing section handed out by NullProfiler."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FrameProfiler:
+    """
+    Per-section frame timings over a rolling window.
+
+    Each section keeps its last ``window`` durations (perf_counter_ns), from
+    which the p50/p95/p99 are computed on demand. The stats can be drawn
+    as an overlay and written to JSON or CSV.
+    """
+
+    enabled = True
+
+    def __init__(self, window=600, refresh=30):
+        """
+        Initialize the profiler.
+
+        Args:
+            window (int): Samples kept per section (600 = 10s at 60 FPS)
+            refresh (int): Frames between overlay text updates
+        """
+        self.window = window
+        self.refresh = refresh
+        self.visible = False
+        self._samples = {}
+        self._sections = {}
+        self._lines = []
+        self._frames = 0
+
+    def section(self, name):
+        """
+        Return a context manager timing a section of the frame.
+
+        Args:
+            name (str): Section name, e.g. "collisions"
+        """
+        section = self._sections.get(name)
+        if section is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+            section = self._sections[name] = _Section(samples)
+        return section
+
+    def stats(self):
+        """
+        Summarize every section in milliseconds.
+
+        Returns:
+            dict: name -> {"count", "mean", "p50", "p95", "p99", "max"}
+        """
+        order = {name: i for i, name in enumerate(SECTIONS)}
+        summary = {}
+        for name in sorted(self._samples, key=lambda name: (order.get(name, len(order)), name)):
+            ordered = sorted(self._samples[name])
+            if not ordered:
+                continue
+            summary[name] = {
+                "count": len(ordered),
+                "mean": sum(ordered) / len(ordered) / 1e6,
+                "p50": _percentile(ordered, 0.50) / 1e6,
+                "p95": _percentile(ordered, 0.95) / 1e6,
+                "p99": _percentile(ordered, 0.99) / 1e6,
+                "max": ordered[-1] / 1e6,
+            }
+        return summary
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self._frames = 0
+
+    def sprites(self, text_renderer, right, top=10, size=20, color=(255, 255, 0)):
+        """
+        Return the overlay lines ready to draw, right-aligned.
+
+        The text is refreshed every ``refresh`` calls, not every frame.
+
+        Args:
+            text_renderer (TextRenderer): Cache used to render the lines
+            right (int): Screen x the lines are aligned to
+            top (int): Screen y of the first line
+            size (int): Font size in points
+            color (tuple): RGB text color
+
+        Returns:
+            list: (text, surface, rect) for each line, empty when hidden
+        """
+        if not self.visible:
+            return []
+        if self._frames % self.refresh == 0:
+            self._lines = ["section      p50     p95     p99 ms"] + [
+                f"{name:<10}{row['p50']:>7.2f} {row['p95']:>7.2f} {row['p99']:>7.2f}"
+                for name, row in self.stats().items()]
+        self._frames += 1
+        sprites = []
+        for i, text in enumerate(self._lines):
+            surface = text_renderer.render(text, size, color)
+            sprites.append((text, surface, surface.get_rect(topright=(right, top + i * size))))
+        return sprites
+
+    def dump(self, path):
+        """
+        Write the stats to a file, as CSV if the name ends in .csv, else JSON.
+
+        Args:
+            path (str): Destination file
+        """
+        stats = self.stats()
+        with open(path, "w", newline="") as f:
+            if path.lower().endswith(".csv"):
+                writer = csv.writer(f)
+                writer.writerow(["section", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+                for name, row in stats.items():
+                    writer.writerow([name, row["count"]] + [f"{row[key]:.6f}" for key in
+                                                           ("mean", "p50", "p95", "p99", "max")])
+            else:
+                json.dump(stats, f, indent=2)
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off: every call is a no-op."""
+
+    enabled = False
+    visible = False
+
+    def section(self, name):
+        return _NULL_SECTION
+
+    def stats(self):
+        return {}
+
+    def toggle(self):
+        pass
+
+    def sprites(self, text_renderer, right, top=10, size=20, color=(255, 255, 0)):
+        return []
+
+    def dump(self, path):
+        pass
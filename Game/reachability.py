@@ -0,0 +1,121 @@
+from array import array
+
+from Game.maze_generator import neighbor_offsets
+
+
+class Reachability:
+    """
+    Connectivity table for a maze, rooted at a start cell.
+
+    All arrays are flat (index = y * width + x). ``dist`` holds the number
+    of steps from the start (-1 if unreachable), ``parent`` the previous
+    cell on a shortest path back to the start (-1 for the start and for
+    unreachable cells), and ``order`` the reachable cells in the order they
+    were discovered.
+    """
+
+    def __init__(self, width, height, start, dist, parent, order):
+        """
+        Initialize the table.
+
+        Args:
+            width (int): Width of the maze in cells
+            height (int): Height of the maze in cells
+            start (int): Flat index of the root cell
+            dist (array): Steps from the start per cell, -1 when unreachable
+            parent (array): Previous cell towards the start, -1 for none
+            order (array): Reachable cells in discovery order
+        """
+        self.width = width
+        self.height = height
+        self.start = start
+        self.dist = dist
+        self.parent = parent
+        self.order = order
+
+    @classmethod
+    def from_maze(cls, maze, start=0):
+        """
+        Compute the table with a breadth-first search over the wall masks.
+
+        Args:
+            maze (MazeGenerator): Maze to search
+            start (int): Flat index of the root cell
+
+        Returns:
+            Reachability: The table
+        """
+        cells = maze.cells
+        width = maze.width
+        size = width * maze.height
+        dist = array("i", [-1]) * size
+        parent = array("i", [-1]) * size
+        # The queue is the discovery order itself: each cell is appended once
+        order = array("i", [start])
+        dist[start] = 0
+        sides = neighbor_offsets(width)
+        head = 0
+        while head < len(order):
+            index = order[head]
+            head += 1
+            mask = cells[index]
+            step = dist[index] + 1
+            for wall, offset in sides:
+                if not mask & wall:
+                    neighbor = index + offset
+                    if dist[neighbor] < 0:
+                        dist[neighbor] = step
+                        parent[neighbor] = index
+                        order.append(neighbor)
+        return cls(width, maze.height, start, dist, parent, order)
+
+    def cells(self):
+        """
+        Return every reachable cell.
+
+        Returns:
+            list: (x, y) tuples in discovery order
+        """
+        width = self.width
+        return [(index % width, index // width) for index in self.order]
+
+    def is_reachable(self, x, y):
+        """Check whether cell (x, y) can be reached from the start."""
+        return self.dist[y * self.width + x] >= 0
+
+    def distance(self, x, y):
+        """Return the number of steps from the start to (x, y), or -1."""
+        return self.dist[y * self.width + x]
+
+    def path(self, source, target):
+        """
+        Return a shortest path between two reachable cells.
+
+        In a perfect maze the parent pointers form a spanning tree, so the
+        path is found by climbing from both ends to their common ancestor.
+        In a maze with loops the result is still a valid path, and exact
+        whenever one end is the start.
+
+        Args:
+            source (tuple): (x, y) of the first cell
+            target (tuple): (x, y) of the last cell
+
+        Returns:
+            list: (x, y) cells from source to target inclusive, or an empty
+                list if either cell is unreachable
+        """
+        width, dist, parent = self.width, self.dist, self.parent
+        a = source[1] * width + source[0]
+        b = target[1] * width + target[0]
+        if dist[a] < 0 or dist[b] < 0:
+            return []
+        head, tail = [a], [b]
+        while a != b:
+            if dist[a] >= dist[b]:
+                a = parent[a]
+                head.append(a)
+            else:
+                b = parent[b]
+                tail.append(b)
+        tail.pop()
+        return [(index % width, index // width) for index in head + tail[::-1]]
@@ -0,0 +1,180 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Redraw only the parts of the screen that changed since the last frame.
+
+    The maze and the patches form a static scene that is composed once per
+    level and shifted in place when the view scrolls. Moving sprites (the player,
+    HUD lines) are drawn on top of it; each frame the areas they left are
+    restored from the scene, sprites touching a changed area are redrawn,
+    and only those rectangles are pushed with ``pygame.display.update``.
+    """
+
+    def __init__(self, screen, background=(0, 0, 0)):
+        """
+        Initialize the renderer.
+
+        Args:
+            screen (pygame.Surface): Display surface to draw on
+            background (tuple): RGB color behind the maze
+        """
+        self.screen = screen
+        self.background = background
+        self.base = None   # Background plus maze walls
+        self.scene = None  # Base plus the static sprites (patches)
+        self.statics = []
+        self._previous = []
+        self._dirty = []
+        self._full = True
+
+    def reset(self, draw_background, statics=()):
+        """
+        Compose the static scene and schedule a full redraw.
+
+        Called for every new level. The scene surfaces are kept from one
+        call to the next while the screen size does not change.
+
+        Args:
+            draw_background (callable): Draws the maze onto a screen-sized
+                surface, e.g. ``maze.draw``
+            statics (iterable): (surface, rect) pairs drawn into the scene,
+                in screen coordinates
+        """
+        size = self.screen.get_size()
+        if self.base is None or self.base.get_size() != size:
+            self.base = pygame.Surface(size).convert()
+            self.scene = pygame.Surface(size).convert()
+        self.base.fill(self.background)
+        draw_background(self.base)
+        self.scene.blit(self.base, (0, 0))
+        self.statics = [(surface, pygame.Rect(rect)) for surface, rect in statics]
+        self.scene.blits(self.statics, doreturn=False)
+        self._previous = []
+        self._dirty = []
+        self._full = True
+
+    def scroll(self, dx, dy, draw_background, statics=()):
+        """
+        Follow a camera move without composing the whole scene again.
+
+        The scene is shifted in place and only the strips the move exposed
+        are drawn; the next frame updates the whole screen.
+
+        Args:
+            dx (int): Pixels the view moved right (negative for left)
+            dy (int): Pixels the view moved down (negative for up)
+            draw_background (callable): Same as for ``reset``; only the
+                exposed strips are drawn, through the surface's clip
+            statics (iterable): (surface, rect) pairs of the static sprites
+                at their new screen positions
+        """
+        width, height = self.screen.get_size()
+        if self.base is None or abs(dx) >= width or abs(dy) >= height:
+            self.reset(draw_background, statics)
+            return
+        self.base.scroll(-dx, -dy)
+        self.scene.scroll(-dx, -dy)
+        self.statics = [(surface, pygame.Rect(rect)) for surface, rect in statics]
+        exposed = []
+        if dx:
+            exposed.append(pygame.Rect(width - dx if dx > 0 else 0, 0, abs(dx), height))
+        if dy:
+            exposed.append(pygame.Rect(0, height - dy if dy > 0 else 0, width, abs(dy)))
+        for strip in exposed:
+            self.base.set_clip(strip)
+            self.base.fill(self.background)
+            draw_background(self.base)
+            # Clipped too, so statics straddling the strip are not blended twice
+            self.scene.set_clip(strip)
+            self.scene.blit(self.base, strip, strip)
+            self.scene.blits([static for static in self.statics if static[1].colliderect(strip)],
+                             doreturn=False)
+        self.base.set_clip(None)
+        self.scene.set_clip(None)
+        self._previous = []
+        self._dirty = []
+        self._full = True
+
+    def remove_static(self, rect):
+        """
+        Erase a static sprite (e.g. a collected patch) from the scene.
+
+        Args:
+            rect (pygame.Rect): Area the sprite occupied
+        """
+        rect = pygame.Rect(rect)
+        for i, (_, static_rect) in enumerate(self.statics):
+            if static_rect == rect:
+                del self.statics[i]
+                break
+        # Statics overlapping the erased area are restored and drawn back whole
+        area = rect
+        while True:
+            overlapping = [static_rect for _, static_rect in self.statics
+                           if static_rect.colliderect(area)]
+            grown = area.unionall(overlapping) if overlapping else area
+            if grown == area:
+                break
+            area = grown
+        self.scene.blit(self.base, area, area)
+        self.scene.blits([static for static in self.statics if static[1].colliderect(area)],
+                         doreturn=False)
+        self._dirty.append(area)
+
+    def invalidate(self):
+        """Force the next frame to redraw and update the whole screen."""
+        self._full = True
+
+    def draw(self, sprites):
+        """
+        Draw one frame.
+
+        Args:
+            sprites (list): (key, surface, rect) tuples in draw order; ``key``
+                identifies the sprite's content (e.g. the HUD text) so an
+                unchanged sprite at the same place is not redrawn
+
+        Returns:
+            list: Rectangles that were updated on the display
+        """
+        current = [(key, pygame.Rect(rect)) for key, _, rect in sprites]
+        if self._full:
+            self.screen.blit(self.scene, (0, 0))
+            self.screen.blits([(surface, rect) for _, surface, rect in sprites], doreturn=False)
+            pygame.display.flip()
+            self._full = False
+            self._dirty = []
+            self._previous = current
+            return [self.screen.get_rect()]
+
+        dirty = self._dirty
+        self._dirty = []
+        # Areas vacated by sprites that moved or changed, and the areas they now cover
+        dirty.extend(rect for key, rect in self._previous if (key, rect) not in current)
+        dirty.extend(rect for key, rect in current if (key, rect) not in self._previous)
+        self._previous = current
+        if not dirty:
+            return []
+
+        # A sprite touching a restored area is redrawn whole, so its whole
+        # rect is restored too (blending it over itself would smear alpha edges)
+        redraw = []
+        pending = list(sprites)
+        grown = True
+        while grown:
+            grown = False
+            for sprite in pending[:]:
+                rect = pygame.Rect(sprite[2])
+                if rect.collidelist(dirty) != -1:
+                    dirty.append(rect)
+                    redraw.append(sprite)
+                    pending.remove(sprite)
+                    grown = True
+
+        self.screen.blits([(self.scene, rect, rect) for rect in dirty], doreturn=False)
+        self.screen.blits([(sprite[1], sprite[2]) for sprite in sprites if sprite in redraw],
+                          doreturn=False)
+        pygame.display.update(dirty)
+        return dirty
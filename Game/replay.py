@@ -0,0 +1,231 @@
+import struct
+import sys
+import time
+import zlib
+
+from Game.agents import DIRECTIONS
+
+# File layout: header, then the zlib-compressed moves. Each move is one
+# varint: ticks since the previous move shifted left by two, OR the index
+# of its direction in DIRECTIONS. Ticks only count simulation steps taken
+# while playing, so the win screen and frame rate do not matter.
+MAGIC = b"CSRP"
+FORMAT_VERSION = 1
+
+# magic, version, flags, seed, ticks, moves, final level, score, x, y, algorithm
+_HEADER = struct.Struct("<4sBBxxQIIIIII16s")
+_FLAG_FINISHED = 0x01
+
+
+class ReplayError(ValueError):
+    """Raised on a malformed replay file or when playback desyncs."""
+
+
+def _encode_varint(value, out):
+    """Append an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varints(data):
+    """Yield the unsigned LEB128 varints of a byte string."""
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+    if shift:
+        raise ReplayError("Truncated move data")
+
+
+class Replay:
+    """
+    A recorded session: the run's seed plus every move the player started.
+
+    Levels are generated from the seed, so the moves and the tick each one
+    started on are enough to replay the whole session. A minute of
+    continuous walking is about 120 moves, or a few hundred bytes.
+
+    Attributes:
+        seed (int): Seed of the recorded run
+        algorithm (str): Maze algorithm forced on every level, or None
+        ticks (int): Simulation ticks played
+        moves (list): (tick, (dx, dy)) for each move, in order
+        final (tuple): (level, score, x, y) at the end, or None if unknown
+    """
+
+    def __init__(self, seed, algorithm=None):
+        """
+        Start an empty recording.
+
+        Args:
+            seed (int): Seed of the run being recorded
+            algorithm (str): The run's ``Game.algorithm``
+        """
+        self.seed = seed
+        self.algorithm = algorithm
+        self.ticks = 0
+        self.moves = []
+        self.final = None
+
+    def record(self, tick, step):
+        """
+        Log a move.
+
+        Args:
+            tick (int): ``Game.ticks`` when the move started
+            step (tuple): (dx, dy) unit step
+        """
+        self.moves.append((tick, tuple(step)))
+
+    def finish(self, game):
+        """Store the tick count and end state used to check playback."""
+        self.ticks = game.ticks
+        self.final = (game.level, game.score, *game.player_grid)
+
+    def encode(self):
+        """Return the compressed move stream."""
+        data = bytearray()
+        previous = 0
+        for tick, step in self.moves:
+            _encode_varint((tick - previous) << 2 | DIRECTIONS.index(step), data)
+            previous = tick
+        return zlib.compress(bytes(data), 9)
+
+    def save(self, path):
+        """
+        Write the replay to a file.
+
+        Args:
+            path (str): Destination file
+        """
+        level, score, x, y = self.final or (0, 0, 0, 0)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, _FLAG_FINISHED if self.final else 0,
+                                 self.seed, self.ticks, len(self.moves), level, score, x, y,
+                                 (self.algorithm or "").encode()[:16]))
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay written by ``save``.
+
+        Args:
+            path (str): File to read
+
+        Returns:
+            Replay: The recording
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            body = f.read()
+        if len(header) != _HEADER.size:
+            raise ReplayError("Truncated header")
+        (magic, version, flags, seed, ticks, count, level, score, x, y,
+         algorithm) = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != FORMAT_VERSION:
+            raise ReplayError(f"Unsupported format version {version}")
+        try:
+            data = zlib.decompress(body)
+        except zlib.error as e:
+            raise ReplayError(f"Corrupt move data: {e}") from None
+        replay = cls(seed, algorithm.rstrip(b"\0").decode() or None)
+        replay.ticks = ticks
+        replay.final = (level, score, x, y) if flags & _FLAG_FINISHED else None
+        tick = 0
+        for value in _decode_varints(data):
+            tick += value >> 2
+            replay.moves.append((tick, DIRECTIONS[value & 3]))
+        if len(replay.moves) != count:
+            raise ReplayError(f"Expected {count} moves, got {len(replay.moves)}")
+        return replay
+
+
+class ReplayController:
+    """Feed a recorded session's moves back to the game, tick for tick."""
+
+    def __init__(self, replay):
+        """
+        Initialize the controller.
+
+        Args:
+            replay (Replay): The recording to play
+        """
+        self.moves = replay.moves
+        self.index = 0
+
+    def direction(self, game):
+        """Return the move recorded for the current tick, or None."""
+        if self.index >= len(self.moves):
+            return None
+        tick, step = self.moves[self.index]
+        if tick > game.ticks:
+            return None
+        if tick < game.ticks:
+            # The player was still moving when the recording started a move
+            raise ReplayError(f"Replay desynced at tick {tick}")
+        self.index += 1
+        return step
+
+
+def play_replay(path, headless=True, render_every=0, **options):
+    """
+    Play a replay as fast as the CPU allows and check where it ends.
+
+    Args:
+        path (str): Replay file
+        headless (bool): Use SDL's dummy drivers instead of opening a window
+        render_every (int): Render every n-th tick, or 0 to skip drawing
+        **options: Extra Game arguments (e.g. ``profile_output``); prefetch
+            defaults to 0 so every level is built on the measured thread
+
+    Returns:
+        dict: "ticks", "seconds", "speed" (times real time) and "levels"
+            completed
+
+    Raises:
+        ReplayError: If the game does not end where the recording did
+    """
+    # Import here to avoid circular imports
+    from Game.game import Game, SIM_DT, STATE_LEVEL_COMPLETE
+
+    replay = Replay.load(path)
+    options.setdefault("prefetch", 0)
+    game = Game(replay.algorithm, headless=headless, seed=replay.seed,
+                controller=ReplayController(replay), **options)
+    start = time.perf_counter()
+    levels = game.run_headless(replay.ticks, render_every)
+    elapsed = time.perf_counter() - start
+    if (game.state == STATE_LEVEL_COMPLETE and replay.final is not None
+            and replay.final[0] > game.level):
+        # The recording moved on from the win screen but played no tick after
+        game.level += 1
+        game.new_level()
+    if game.levels:
+        game.levels.cancel()
+    if game.profile_output:
+        game.profiler.dump(game.profile_output)
+    final = (game.level, game.score, *game.player_grid)
+    if replay.final is not None and final != replay.final:
+        raise ReplayError(f"Replay ended at {final}, recorded {replay.final}")
+    return {
+        "ticks": replay.ticks,
+        "seconds": elapsed,
+        "speed": replay.ticks * SIM_DT / elapsed if elapsed else float("inf"),
+        "levels": levels,
+    }
+
+
+if __name__ == "__main__":
+    # python -m Game.replay <file> [render_every]
+    stats = play_replay(sys.argv[1], render_every=int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    print(f"Replayed {stats['ticks']} ticks ({stats['levels']} levels) in "
+          f"{stats['seconds']:.2f}s: {stats['speed']:.0f}x real time")
@@ -0,0 +1,145 @@
+import pygame
+
+
+class PatchIndex:
+    """
+    Collectible rectangles bucketed by the maze cells they overlap.
+
+    Collision queries only look at the buckets covered by the query
+    rectangle, and removal is O(1). Iterating the index yields every
+    rectangle in insertion order, so it can stand in for a list of patches.
+    ``version`` changes on every add and remove, so derived data (such as a
+    prebuilt blit list) can tell when it is stale.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Initialize an empty index.
+
+        Args:
+            cell_size (int): Size of each maze cell in pixels
+        """
+        self.cell_size = cell_size
+        self._rects = {}  # key -> rect
+        self._cells = {}  # (x, y) cell -> {key: rect}
+        self._next_key = 0
+        self.version = 0
+
+    def _cells_for(self, rect):
+        """Yield the (x, y) cells a rectangle overlaps."""
+        size = self.cell_size
+        for y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for x in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield x, y
+
+    def add(self, rect):
+        """
+        Add a rectangle to the index.
+
+        Args:
+            rect (pygame.Rect): Area of the collectible
+
+        Returns:
+            int: Key identifying this entry (rectangles may repeat)
+        """
+        rect = pygame.Rect(rect)
+        key = self._next_key
+        self._next_key += 1
+        self._rects[key] = rect
+        self.version += 1
+        for cell in self._cells_for(rect):
+            self._cells.setdefault(cell, {})[key] = rect
+        return key
+
+    def remove(self, key):
+        """
+        Remove an entry.
+
+        Args:
+            key (int): Key returned by ``add``
+
+        Returns:
+            pygame.Rect: The removed rectangle
+        """
+        rect = self._rects.pop(key)
+        self.version += 1
+        for cell in self._cells_for(rect):
+            bucket = self._cells[cell]
+            del bucket[key]
+            if not bucket:
+                del self._cells[cell]
+        return rect
+
+    def colliding(self, rect):
+        """
+        Find the entries overlapping a rectangle.
+
+        Args:
+            rect (pygame.Rect): Query area, e.g. the player's rect
+
+        Returns:
+            list: Keys of the overlapping entries
+        """
+        hits = []
+        for cell in self._cells_for(rect):
+            bucket = self._cells.get(cell)
+            if bucket:
+                hits.extend(key for key, patch in bucket.items()
+                            if patch.colliderect(rect) and key not in hits)
+        return hits
+
+    def pop_colliding(self, rect):
+        """
+        Remove and return every entry overlapping a rectangle.
+
+        Args:
+            rect (pygame.Rect): Query area
+
+        Returns:
+            list: The removed rectangles
+        """
+        return [self.remove(key) for key in self.colliding(rect)]
+
+    def query(self, rect):
+        """
+        Return the rectangles overlapping an area, e.g. the camera's view.
+
+        Args:
+            rect (pygame.Rect): Query area
+
+        Returns:
+            list: The overlapping rectangles, each listed once
+        """
+        found = {}
+        for cell in self._cells_for(rect):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found.update((key, patch) for key, patch in bucket.items()
+                             if patch.colliderect(rect))
+        return list(found.values())
+
+    def cell(self, x, y):
+        """
+        Return the rectangles overlapping one maze cell.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            list: Rectangles in that cell
+        """
+        return list(self._cells.get((x, y), {}).values())
+
+    def cells(self):
+        """Return the set of (x, y) cells that hold at least one entry."""
+        return set(self._cells)
+
+    def __iter__(self):
+        return iter(list(self._rects.values()))
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __bool__(self):
+        return bool(self._rects)
@@ -0,0 +1,52 @@
+"""
+Generation time for every registered maze algorithm, plus a streaming run of
+Eller's algorithm on a maze far larger than the game window.
+
+Usage:
+    python benchmarks/bench_algorithms.py [--sizes 15 100 500 1000] [--stream 5000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator
+from Game.maze_algorithms import ALGORITHMS, eller_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 100, 500, 1000])
+    parser.add_argument("--stream", type=int, default=5000,
+                        help="side of the maze streamed row by row with Eller's algorithm")
+    args = parser.parse_args()
+
+    names = sorted(ALGORITHMS)
+    print(f"{'size':>10} " + " ".join(f"{name:>12}" for name in names))
+    for side in args.sizes:
+        times = []
+        for name in names:
+            maze = MazeGenerator(side, side)
+            start = time.perf_counter()
+            maze.generate(name)
+            times.append(time.perf_counter() - start)
+        print(f"{side:>4}x{side:<5} " + " ".join(f"{t:>11.3f}s" for t in times))
+
+    if args.stream:
+        start = time.perf_counter()
+        rows = sum(1 for _ in eller_rows(args.stream, args.stream))
+        elapsed = time.perf_counter() - start
+        # Peak memory depends on width only, so trace a short strip (tracing is slow)
+        tracemalloc.start()
+        sum(1 for _ in eller_rows(args.stream, 50))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"eller stream {args.stream}x{args.stream}: {rows} rows in {elapsed:.2f}s "
+              f"({args.stream * args.stream / elapsed / 1e6:.2f} M cells/s), "
+              f"peak {peak / 1e6:.2f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Loading sprites one file each versus from a packed atlas.
+
+Synthetic sprites are written to a temporary folder, packed once, then
+loaded both ways (decode and convert to the display format).
+
+Usage:
+    python benchmarks/bench_atlas.py [--counts 2 50 500] [--repeats 5]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.atlas import SpriteAtlas
+
+
+def write_sprites(directory, count, rng):
+    """Save ``count`` small sprites of assorted sizes as PNGs."""
+    for i in range(count):
+        surface = pygame.Surface((rng.randint(12, 48), rng.randint(12, 48)), pygame.SRCALPHA)
+        surface.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256), 255))
+        pygame.image.save(surface, os.path.join(directory, f"sprite{i}.png"))
+
+
+def load_files(directory, names):
+    return {name: pygame.image.load(os.path.join(directory, name + ".png")).convert_alpha()
+            for name in names}
+
+
+def load_packed(index_path, names):
+    atlas = SpriteAtlas.load(index_path)
+    atlas.surface = atlas.surface.convert_alpha()
+    return {name: atlas.get(name) for name in names}
+
+
+def best_ms(func, repeats):
+    """Fastest of several runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[2, 50, 500])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    rng = random.Random(0)
+    print(f"{'sprites':>8} {'files ms':>9} {'atlas ms':>9} {'atlas size':>11}")
+    for count in args.counts:
+        with tempfile.TemporaryDirectory() as directory:
+            sprites = os.path.join(directory, "sprites")
+            os.makedirs(sprites)
+            write_sprites(sprites, count, rng)
+            index = os.path.join(directory, "atlas.json")
+            atlas = SpriteAtlas.build(sprites, os.path.join(directory, "atlas.png"), index)
+            names = list(atlas.rects)
+            files = best_ms(lambda: load_files(sprites, names), args.repeats)
+            packed = best_ms(lambda: load_packed(index, names), args.repeats)
+            width, height = atlas.surface.get_size()
+            print(f"{count:>8} {files:>9.2f} {packed:>9.2f} {f'{width}x{height}':>11}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Throughput of the vectorized batch generator against looping MazeGenerator.
+
+Usage:
+    python benchmarks/bench_batch.py [--count 10000] [--size 30] [--loop-sample 1000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator
+from Game.batch_generator import BATCH_ALGORITHMS, generate_batch, to_mazes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--size", type=int, default=30)
+    parser.add_argument("--loop-sample", type=int, default=1000,
+                        help="mazes actually generated in the loop; the total is extrapolated")
+    args = parser.parse_args()
+
+    side = args.size
+    start = time.perf_counter()
+    for _ in range(args.loop_sample):
+        MazeGenerator(side, side).generate()
+    loop_time = (time.perf_counter() - start) * args.count / args.loop_sample
+    print(f"{args.count} mazes of {side}x{side}")
+    print(f"{'MazeGenerator loop (dfs)':>28}: {loop_time:8.2f}s  {args.count / loop_time:10.0f} mazes/s")
+
+    for name in sorted(BATCH_ALGORITHMS):
+        start = time.perf_counter()
+        generate_batch(args.count, side, side, name)
+        elapsed = time.perf_counter() - start
+        print(f"{'batch ' + name:>28}: {elapsed:8.2f}s  {args.count / elapsed:10.0f} mazes/s  "
+              f"({loop_time / elapsed:.1f}x)")
+
+    masks = generate_batch(args.count, side, side)
+    start = time.perf_counter()
+    to_mazes(masks)
+    print(f"{'to_mazes conversion':>28}: {time.perf_counter() - start:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Frame time and wall-surface memory of the chunked camera as mazes grow.
+
+Each maze is swept diagonally by the camera while the visible chunks are
+drawn. Chunk memory is bounded by the cache size, where a single
+pre-rendered wall surface grows with the square of the maze side.
+
+Usage:
+    python benchmarks/bench_camera.py [--frames 600] [--sizes 25 100 500 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.batch_generator import generate_batch, to_mazes
+from Game.camera import Camera, ChunkCache
+from Game.game import WIDTH, HEIGHT, CELL_SIZE
+
+
+def measure(side, frames, screen):
+    """Return (ms per frame, cached chunk bytes, full surface bytes) for one maze size."""
+    maze = to_mazes(generate_batch(1, side, side, seed=side), CELL_SIZE)[0]
+    world = side * CELL_SIZE + 2
+    camera = Camera(WIDTH, HEIGHT, world, world)
+    chunks = ChunkCache(maze)
+    start = time.perf_counter()
+    for frame in range(frames):
+        # Walk the target along the diagonal, 8px per frame, bouncing at the ends
+        offset = frame * 8 % (2 * world)
+        position = min(offset, 2 * world - offset)
+        camera.follow((position, position))
+        screen.fill((0, 0, 0))
+        chunks.draw(screen, camera)
+    elapsed = (time.perf_counter() - start) / frames * 1000
+    depth = screen.get_bytesize()
+    chunk_bytes = sum(chunk.get_width() * chunk.get_height() * depth
+                      for chunk in chunks._chunks.values())
+    return elapsed, chunk_bytes, world * world * depth
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 500, 2000])
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    print(f"{'cells':>11} {'ms/frame':>9} {'chunk cache':>12} {'full surface':>13}")
+    for side in args.sizes:
+        elapsed, chunk_bytes, full_bytes = measure(side, args.frames, screen)
+        print(f"{side:>5}x{side:<5} {elapsed:9.3f} {chunk_bytes / 2**20:10.1f}MB "
+              f"{full_bytes / 2**20:11.1f}MB")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
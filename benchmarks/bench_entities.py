@@ -0,0 +1,68 @@
+"""
+Cost of drawing many collectibles: one blit per entity versus a single
+``Surface.blits`` call, with the sprite in its loaded format versus
+converted to the display format.
+
+Usage:
+    python benchmarks/bench_entities.py [--counts 100 1000 5000] [--frames 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.game import WIDTH, HEIGHT
+
+
+def per_blit(screen, blits):
+    for surface, rect in blits:
+        screen.blit(surface, rect)
+
+
+def batched(screen, blits):
+    screen.blits(blits, doreturn=False)
+
+
+def measure(screen, draw, blits, frames):
+    """Mean milliseconds per frame of draw(screen, blits)."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        draw(screen, blits)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    # The patch sprite as the game creates it: a 32-bit SRCALPHA surface
+    raw = pygame.Surface((20, 20), pygame.SRCALPHA, 32)
+    pygame.draw.rect(raw, (0, 255, 0), (0, 0, 20, 20))
+    sprites = {"loaded": raw, "converted": raw.convert_alpha()}
+
+    rng = random.Random(0)
+    print(f"{'patches':>8} {'sprite':>10} {'per blit ms':>12} {'blits() ms':>11}")
+    for count in args.counts:
+        rects = [pygame.Rect(rng.randrange(WIDTH - 20), rng.randrange(HEIGHT - 20), 20, 20)
+                 for _ in range(count)]
+        for name, sprite in sprites.items():
+            blits = [(sprite, rect) for rect in rects]
+            loop = measure(screen, per_blit, blits, args.frames)
+            batch = measure(screen, batched, blits, args.frames)
+            print(f"{count:>8} {name:>10} {loop:>12.3f} {batch:>11.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
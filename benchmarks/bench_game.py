@@ -0,0 +1,128 @@
+"""
+Headless benchmark suite for Game: maze generation, BFS, collision checks and
+per-subsystem frame time across difficulty levels.
+
+A greedy agent plays each level with the dummy video/audio drivers. Results
+can be saved as JSON and compared against a saved baseline to catch
+regressions (the script exits with status 1 when a metric gets slower than
+the allowed tolerance).
+
+Usage:
+    python benchmarks/bench_game.py [--difficulties 1 10 25] [--ticks 2000]
+                                    [--json out.json] [--baseline base.json --tolerance 0.25]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.game import Game, CELL_SIZE, BASE_MAZE_SIZE, STATE_LEVEL_COMPLETE
+from Game.maze_generator import MazeGenerator
+from Game.maze_algorithms import ALGORITHMS
+from Game.agents import GreedyAgent
+from Game.distance_field import DistanceField
+
+
+def mean_ms(func, repeats):
+    """Mean wall time of func() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def bench_difficulty(game, difficulty, ticks, repeats):
+    """Collect every metric for one difficulty level."""
+    side = BASE_MAZE_SIZE + difficulty
+    results = {}
+    for name in sorted(ALGORITHMS):
+        results[f"generate.{name}"] = mean_ms(
+            lambda: MazeGenerator(side, side, CELL_SIZE).generate(name), repeats)
+
+    game.difficulty = difficulty
+    game.new_level()
+    results["bfs"] = mean_ms(game._find_accessible_cells, repeats)
+    results["distance_field"] = mean_ms(
+        lambda: DistanceField(game.maze, game.patches.cells()), repeats)
+    results["collisions"] = mean_ms(game._check_collisions, repeats * 10)
+
+    # Play with the greedy agent, timing each subsystem separately
+    game.difficulty = difficulty
+    game.new_level()
+    totals = dict.fromkeys(("input", "movement", "collisions", "render"), 0.0)
+    clock = time.perf_counter
+    for _ in range(ticks):
+        if game.state == STATE_LEVEL_COMPLETE:
+            game.difficulty = difficulty
+            game.new_level()
+        game.previous_pos = game.player_pos
+        t0 = clock()
+        game._handle_input()
+        t1 = clock()
+        game._update_movement()
+        t2 = clock()
+        game._check_collisions()
+        t3 = clock()
+        game.render()
+        t4 = clock()
+        totals["input"] += t1 - t0
+        totals["movement"] += t2 - t1
+        totals["collisions"] += t3 - t2
+        totals["render"] += t4 - t3
+    for name, total in totals.items():
+        results[f"frame.{name}"] = total / ticks * 1000
+    results["frame.total"] = sum(totals.values()) / ticks * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--difficulties", type=int, nargs="+", default=[1, 10, 25])
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--dirty-rects", action="store_true")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --json")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown versus the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    # No background level building: it would compete with the timed code
+    game = Game(headless=True, controller=GreedyAgent(),
+                dirty_rects=args.dirty_rects, max_fps=0, prefetch=0)
+    results = {}
+    for difficulty in args.difficulties:
+        side = BASE_MAZE_SIZE + difficulty
+        print(f"difficulty {difficulty} ({side}x{side})")
+        metrics = bench_difficulty(game, difficulty, args.ticks, args.repeats)
+        for name, value in metrics.items():
+            print(f"  {name:<24} {value:10.4f} ms")
+        results[str(difficulty)] = metrics
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = []
+        for difficulty, metrics in results.items():
+            for name, value in metrics.items():
+                before = baseline.get(difficulty, {}).get(name)
+                if before and value > before * (1 + args.tolerance):
+                    regressions.append(f"difficulty {difficulty} {name}: "
+                                       f"{before:.4f} -> {value:.4f} ms")
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
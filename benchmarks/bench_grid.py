@@ -0,0 +1,110 @@
+"""
+Memory and throughput comparison between the legacy list-of-dicts maze grid
+and the packed one-byte-per-cell grid used by MazeGenerator.
+
+Usage:
+    python benchmarks/bench_grid.py [--sizes 15 100 500 1000 2000] [--legacy-limit 500]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator, WALL_BITS
+
+
+def legacy_grid(width, height):
+    """Build the grid exactly as MazeGenerator.__init__ used to."""
+    return [[{"walls": [True, True, True, True], "visited": False}
+             for _ in range(width)] for _ in range(height)]
+
+
+def legacy_bytes(width, height):
+    """Exact footprint of the legacy grid (bools are shared singletons)."""
+    cell = legacy_grid(1, 1)[0][0]
+    per_cell = sys.getsizeof(cell) + sys.getsizeof(cell["walls"])
+    row = sys.getsizeof([None] * width)
+    return height * (row + width * per_cell) + sys.getsizeof([None] * height)
+
+
+def legacy_generate(width, height):
+    """The original DFS generator running on the dict grid."""
+    grid = legacy_grid(width, height)
+    stack = []
+    current = (0, 0)
+    grid[0][0]["visited"] = True
+    while True:
+        x, y = current
+        neighbors = [(nx, ny) for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y))
+                     if 0 <= nx < width and 0 <= ny < height and not grid[ny][nx]["visited"]]
+        if neighbors:
+            nx, ny = random.choice(neighbors)
+            stack.append(current)
+            if nx == x + 1:
+                grid[y][x]["walls"][1] = False
+                grid[ny][nx]["walls"][3] = False
+            elif nx == x - 1:
+                grid[y][x]["walls"][3] = False
+                grid[ny][nx]["walls"][1] = False
+            elif ny == y + 1:
+                grid[y][x]["walls"][2] = False
+                grid[ny][nx]["walls"][0] = False
+            else:
+                grid[y][x]["walls"][0] = False
+                grid[ny][nx]["walls"][2] = False
+            current = (nx, ny)
+            grid[ny][nx]["visited"] = True
+        elif stack:
+            current = stack.pop()
+        else:
+            return grid
+
+
+def lookup_rate(has_wall, width, height, samples=200000):
+    """Wall lookups per second for random (cell, direction) pairs."""
+    rng = random.Random(0)
+    queries = [(rng.randrange(width), rng.randrange(height), rng.randrange(4))
+               for _ in range(samples)]
+    start = time.perf_counter()
+    for x, y, side in queries:
+        has_wall(x, y, side)
+    return samples / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 100, 500, 1000, 2000])
+    parser.add_argument("--legacy-limit", type=int, default=500,
+                        help="largest side to actually generate with the legacy grid")
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'legacy MB':>10} {'packed MB':>10} {'legacy gen s':>13} "
+          f"{'packed gen s':>13} {'legacy lk/s':>12} {'packed lk/s':>12}")
+    for side in args.sizes:
+        packed = MazeGenerator(side, side)
+        packed_mb = sys.getsizeof(packed.cells) / 1e6
+        legacy_mb = legacy_bytes(side, side) / 1e6
+
+        start = time.perf_counter()
+        packed.generate()
+        packed_gen = time.perf_counter() - start
+        cells = packed.cells
+        packed_rate = lookup_rate(lambda x, y, s: cells[y * side + x] & WALL_BITS[s], side, side)
+
+        legacy_gen = legacy_rate = float("nan")
+        if side <= args.legacy_limit:
+            start = time.perf_counter()
+            grid = legacy_generate(side, side)
+            legacy_gen = time.perf_counter() - start
+            legacy_rate = lookup_rate(lambda x, y, s: grid[y][x]["walls"][s], side, side)
+            del grid
+
+        print(f"{side:>4}x{side:<5} {legacy_mb:>10.2f} {packed_mb:>10.3f} {legacy_gen:>13.3f} "
+              f"{packed_gen:>13.3f} {legacy_rate:>12.0f} {packed_rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+CPU used by the real game loop while nothing happens: the player standing
+still, and the level-complete screen waiting for SPACE. Compares the
+busy loop (redraw every frame) with the idle wait.
+
+The loop is stopped by a QUIT event posted from a timer thread; CPU is
+the process time consumed while it ran. Waking up is checked too: time
+spent waiting must not be replayed as simulation, so a key pressed
+during a wait does not move the player further than one frame would,
+and a level started from the win screen begins with its timer at zero.
+
+Usage:
+    python benchmarks/bench_idle.py [--seconds 3]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.game import Game, CELL_SIZE, SIM_RATE, STATE_LEVEL_COMPLETE
+from Game.agents import DIRECTIONS
+
+
+def cpu_percent(idle_wait, win_screen, seconds):
+    """Share of one core used by Game.run over ``seconds`` of wall time."""
+    game = Game(headless=True, prefetch=0, idle_wait=idle_wait)
+    game.assets.wait()
+    if win_screen:
+        game.state = STATE_LEVEL_COMPLETE
+    timer = threading.Timer(seconds, pygame.event.post, (pygame.event.Event(pygame.QUIT),))
+    cpu, wall = time.process_time(), time.perf_counter()
+    timer.start()
+    try:
+        game.run()
+    except SystemExit:
+        pass
+    return (time.process_time() - cpu) / (time.perf_counter() - wall) * 100
+
+
+class HeldKey:
+    """Controller standing still until ``press`` is called from another thread."""
+
+    def __init__(self, step):
+        self.step = step
+        self.pressed = False
+
+    def press(self):
+        self.pressed = True
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    def direction(self, game):
+        return self.step if self.pressed else None
+
+    def idle(self, game):
+        return not self.pressed
+
+
+def run_until_quit(game, delay, action):
+    """Run the game loop, calling ``action`` from a timer after ``delay`` seconds."""
+    timer = threading.Timer(delay, action)
+    timer.start()
+    try:
+        game.run()
+    except SystemExit:
+        pass
+
+
+def check_wake_up(delay):
+    """Assert a wait is not simulated when it ends."""
+    # Key pressed while waiting: the player may only start the move
+    game = Game(headless=True, prefetch=0)
+    x, y = game.player_grid
+    step = next(step for step in DIRECTIONS if not game.maze.has_wall(x, y, *step))
+    controller = game.controller = HeldKey(step)
+    start = pygame.Vector2(game.player_pos)
+    run_until_quit(game, delay, controller.press)
+    moved = game.player_pos.distance_to(start)
+    assert moved < CELL_SIZE / 4, f"player moved {moved:.0f}px in the wake-up frame"
+    assert game.level_ticks <= (delay + 0.25) * SIM_RATE, game.level_ticks
+
+    # SPACE on the win screen: the new level starts from zero
+    game = Game(headless=True, prefetch=0)
+    game.state = STATE_LEVEL_COMPLETE
+
+    def press_space():
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    run_until_quit(game, delay, press_space)
+    assert game.level == 2 and game.level_ticks < SIM_RATE // 10, game.level_ticks
+    print(f"wake-up after {delay:g}s: player moved {moved:.1f}px, new level timer "
+          f"{game.level_ticks} ticks: ok")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'state':>12} {'busy loop':>10} {'idle wait':>10}")
+    for label, win_screen in (("standing", False), ("win screen", True)):
+        busy = cpu_percent(False, win_screen, args.seconds)
+        idle = cpu_percent(True, win_screen, args.seconds)
+        print(f"{label:>12} {busy:>9.1f}% {idle:>9.1f}%")
+    check_wake_up(0.9)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Generating a large maze from its seed versus loading it from the level cache.
+
+Usage:
+    python benchmarks/bench_level_cache.py [--size 1000] [--algorithm dfs] [--cache-dir DIR]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator
+from Game.level_cache import LevelCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--algorithm", default="dfs")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--cache-dir", help="defaults to a temporary folder")
+    args = parser.parse_args()
+
+    cache = LevelCache(args.cache_dir or tempfile.mkdtemp(prefix="level-cache-"))
+    side = args.size
+    print(f"{side}x{side} {args.algorithm}, seed {args.seed}")
+
+    start = time.perf_counter()
+    maze = MazeGenerator(side, side, seed=args.seed)
+    maze.generate(args.algorithm)
+    generated = time.perf_counter() - start
+    print(f"{'generate':>16}: {generated * 1000:10.1f} ms")
+
+    start = time.perf_counter()
+    cache.store(maze)
+    print(f"{'store':>16}: {(time.perf_counter() - start) * 1000:10.1f} ms  "
+          f"({os.path.getsize(cache.path(args.seed, side, side, args.algorithm)) / 2**20:.1f} MB)")
+
+    start = time.perf_counter()
+    loaded = cache.load(args.seed, side, side, args.algorithm)
+    load_time = time.perf_counter() - start
+    print(f"{'load (mmap)':>16}: {load_time * 1000:10.3f} ms  ({generated / load_time:.0f}x)")
+
+    # Touch every cell once, paging the whole mapping in
+    start = time.perf_counter()
+    checksum = sum(loaded.cells)
+    print(f"{'first full scan':>16}: {(time.perf_counter() - start) * 1000:10.1f} ms")
+    assert checksum == sum(maze.cells) and loaded.reachability().order == maze.reachability().order
+
+
+if __name__ == "__main__":
+    main()
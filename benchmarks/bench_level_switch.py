@@ -0,0 +1,59 @@
+"""
+Time spent in Game.new_level at a level change, with and without the
+background level pipeline.
+
+Each level is played for a while before switching, giving the pipeline
+the time a player would spend on it to build the next one.
+
+Usage:
+    python benchmarks/bench_level_switch.py [--difficulty 40] [--levels 5] [--play 1.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.game import Game, BASE_MAZE_SIZE
+
+
+def measure(prefetch, difficulty, levels, play):
+    """Return the worst and mean level-change time in milliseconds."""
+    game = Game(headless=True, max_fps=0, prefetch=prefetch)
+    game.difficulty = difficulty
+    game.new_level()
+    times = []
+    for _ in range(levels):
+        # "Play" the level: idle like a frame-capped game loop would
+        deadline = time.perf_counter() + play
+        while time.perf_counter() < deadline:
+            game.render()
+            time.sleep(1 / 60)
+        game.level += 1
+        game.difficulty += 1
+        start = time.perf_counter()
+        game.new_level()
+        times.append((time.perf_counter() - start) * 1000)
+    if game.levels:
+        game.levels.cancel(wait=True)
+    return max(times), sum(times) / len(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--difficulty", type=int, default=40)
+    parser.add_argument("--levels", type=int, default=5)
+    parser.add_argument("--play", type=float, default=1.0,
+                        help="seconds spent on each level before switching")
+    args = parser.parse_args()
+
+    side = BASE_MAZE_SIZE + args.difficulty
+    print(f"level changes from {side}x{side}, {args.play:.1f}s per level")
+    for label, prefetch in (("synchronous", 0), ("pipeline", 2)):
+        worst, mean = measure(prefetch, args.difficulty, args.levels, args.play)
+        print(f"{label:>12}: mean {mean:8.2f} ms  worst {worst:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
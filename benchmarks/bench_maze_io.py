@@ -0,0 +1,125 @@
+"""
+Round-trip checks, file size and throughput of the binary maze format
+against pickling the legacy ``grid[y][x]`` dicts.
+
+A large maze is also streamed from Eller's algorithm straight to disk and
+read back row by row, without ever holding the whole grid.
+
+Usage:
+    python benchmarks/bench_maze_io.py [--size 300] [--stream-size 2000]
+"""
+import argparse
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator
+from Game.maze_algorithms import ALGORITHMS, eller_rows
+from Game.maze_io import COMPRESSIONS, MazeReader, MazeWriter, load_maze, save_maze
+
+
+def check_round_trips(directory):
+    """Save and reload mazes of awkward sizes with every algorithm and compression."""
+    path = os.path.join(directory, "check.maze")
+    count = 0
+    for name in sorted(ALGORITHMS):
+        for width, height in ((1, 1), (1, 7), (7, 1), (13, 9), (64, 33)):
+            maze = MazeGenerator(width, height, seed=width * height)
+            maze.generate(name)
+            for compression in COMPRESSIONS:
+                save_maze(maze, path, compression)
+                loaded = load_maze(path)
+                assert loaded.cells == maze.cells, (name, width, height, compression)
+                assert (loaded.width, loaded.height, loaded.seed, loaded.algorithm) == \
+                    (width, height, maze.seed, name)
+                count += 1
+    print(f"round trips: {count} ok")
+
+
+def legacy_grid(maze):
+    """The maze as the list-of-dicts grid MazeGenerator used to store."""
+    return [[{"walls": list(cell["walls"]), "visited": cell["visited"]} for cell in row]
+            for row in maze.grid]
+
+
+def timed(func):
+    """Return (result, seconds) of func()."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def compare(directory, side):
+    """Print size and save/load time for pickle and each compression."""
+    maze = MazeGenerator(side, side, seed=1)
+    maze.generate()
+    cells = side * side
+    print(f"\n{side}x{side} dfs maze")
+    print(f"{'format':>14} {'bytes':>12} {'bits/cell':>10} {'save Mcell/s':>13} {'load Mcell/s':>13}")
+
+    grid = legacy_grid(maze)
+    path = os.path.join(directory, "grid.pickle")
+
+    def pickle_save():
+        with open(path, "wb") as f:
+            pickle.dump(grid, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def pickle_load():
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    _, save = timed(pickle_save)
+    _, load = timed(pickle_load)
+    size = os.path.getsize(path)
+    print(f"{'pickle (dicts)':>14} {size:>12} {size * 8 / cells:>10.2f} "
+          f"{cells / save / 1e6:>13.2f} {cells / load / 1e6:>13.2f}")
+
+    path = os.path.join(directory, "maze.maze")
+    for compression in COMPRESSIONS:
+        _, save = timed(lambda: save_maze(maze, path, compression))
+        loaded, load = timed(lambda: load_maze(path))
+        assert loaded.cells == maze.cells
+        size = os.path.getsize(path)
+        print(f"{compression:>14} {size:>12} {size * 8 / cells:>10.2f} "
+              f"{cells / save / 1e6:>13.2f} {cells / load / 1e6:>13.2f}")
+
+
+def stream(directory, side):
+    """Generate, write and read back a maze row by row."""
+    path = os.path.join(directory, "stream.maze")
+    rng = random.Random(2)
+    start = time.perf_counter()
+    with open(path, "wb") as f, MazeWriter(f, side, side, 2, "eller") as writer:
+        for row in eller_rows(side, side, rng):
+            writer.write_row(row)
+    written = time.perf_counter() - start
+
+    start = time.perf_counter()
+    openings = 0
+    with open(path, "rb") as f:
+        for row in MazeReader(f).rows():
+            openings += sum(row)
+    read = time.perf_counter() - start
+    print(f"\nstreamed {side}x{side} eller: generate+write {written:.2f}s, read {read:.2f}s, "
+          f"{os.path.getsize(path) / 2**20:.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--stream-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        check_round_trips(directory)
+        compare(directory, args.size)
+        stream(directory, args.stream_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Wall time of tiled multi-process generation against a single
+MazeGenerator, and how it scales with the number of workers.
+
+Each parallel maze is checked to be a single perfect maze: every cell
+reachable from (0, 0) and exactly ``cells - 1`` passages. Scaling is
+only meaningful up to the number of cores of the machine it runs on.
+
+Usage:
+    python benchmarks/bench_parallel.py [--size 2000] [--tile 1024]
+        [--algorithm dfs] [--workers 1 2 4] [--no-check]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator, WALL_RIGHT, WALL_BOTTOM
+from Game.parallel_generator import generate_parallel
+
+
+def check_perfect(maze):
+    """Assert the maze is connected and has no loops."""
+    cells = maze.cells
+    passages = sum(not cell & WALL_RIGHT for cell in cells) + \
+        sum(not cell & WALL_BOTTOM for cell in cells)
+    assert passages == len(cells) - 1, (passages, len(cells))
+    assert len(maze.reachability().order) == len(cells)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--tile", type=int, default=1024)
+    parser.add_argument("--algorithm", default="dfs")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--no-check", action="store_true", help="skip the perfect-maze check")
+    args = parser.parse_args()
+
+    side = args.size
+    print(f"{side}x{side} {args.algorithm}, tiles of {args.tile}, {os.cpu_count()} CPUs")
+    start = time.perf_counter()
+    MazeGenerator(side, side, seed=1).generate(args.algorithm)
+    serial = time.perf_counter() - start
+    print(f"{'MazeGenerator.generate':>24}: {serial:8.2f}s")
+
+    first = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        maze = generate_parallel(side, side, args.algorithm, seed=1, tile=args.tile,
+                                 workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{f'{workers} worker(s)':>24}: {elapsed:8.2f}s  ({serial / elapsed:.2f}x)")
+        if first is None:
+            first = maze.cells
+            if not args.no_check:
+                check_perfect(maze)
+        else:
+            # Same seed and tile size: identical whatever the worker count
+            assert maze.cells == first
+    if not args.no_check:
+        print("perfect maze: ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Patch placement: the old repeated ``rng.choice`` against ``placement.place``
+(uniform, spaced, and distance-weighted) on mazes of growing size.
+
+Every placement is checked for distinct cells and, where the maze has
+room, for the requested spacing along the maze.
+
+Usage:
+    python benchmarks/bench_placement.py [--sizes 25 200 500] [--count 50] [--spacing 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Game.maze_generator import MazeGenerator
+from Game.placement import place
+from Game.reachability import Reachability
+
+
+def old_placement(maze, count, rng):
+    """Game._spawn_entities before the placement engine: draws with replacement."""
+    accessible = maze.reachability((0, 0)).order
+    return [rng.choice(accessible) for _ in range(count)]
+
+
+def check(maze, cells, count, spacing):
+    """Assert the picks are distinct and spaced out."""
+    assert len(cells) == min(count, maze.width * maze.height)
+    assert len(set(cells)) == len(cells)
+    if spacing > 1 and len(cells) <= 50:
+        for cell in cells:
+            dist = Reachability.from_maze(maze, cell).dist
+            assert all(dist[other] >= spacing for other in cells if other != cell)
+
+
+def timed(func, repeats=5):
+    """Mean wall time of func() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return (time.perf_counter() - start) / repeats * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 200, 500])
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--spacing", type=int, default=5)
+    args = parser.parse_args()
+
+    count, spacing = args.count, args.spacing
+    for side in args.sizes:
+        maze = MazeGenerator(side, side, seed=side)
+        maze.generate("eller")
+        maze.reachability((0, 0))  # Built once per level either way
+        old_ms, old = timed(lambda: old_placement(maze, count, random.Random(1)))
+        print(f"{side}x{side}, {count} patches: rng.choice {old_ms:7.3f} ms "
+              f"({count - len(set(old))} stacked)")
+        for label, options in (("uniform", {}),
+                               (f"spacing {spacing}", {"spacing": spacing}),
+                               ("far from start", {"spacing": spacing, "distance_bias": 2.0})):
+            elapsed, cells = timed(lambda: place(maze, count, random.Random(1), **options))
+            check(maze, cells, count, options.get("spacing", 0))
+            dist = maze.reachability().dist
+            mean = sum(dist[cell] for cell in cells) / len(cells)
+            print(f"{label:>24}: {elapsed:7.3f} ms  mean distance from start {mean:7.1f}")
+    # More patches than the spacing allows: falls back to distinct cells
+    tiny = MazeGenerator(3, 3, seed=1)
+    tiny.generate()
+    check(tiny, place(tiny, 20, random.Random(1), spacing=4), 20, 0)
+    print("distinct and spaced: ok")
+
+
+if __name__ == "__main__":
+    main()
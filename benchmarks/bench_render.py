@@ -0,0 +1,54 @@
+"""
+Frame-time comparison between the full-redraw and dirty-rectangle render paths.
+
+The player is swept across the maze while every frame is drawn; simulation
+is skipped so only rendering is measured. From about difficulty 10 the maze
+is larger than the window, so the sweep also scrolls the camera.
+
+Usage:
+    python benchmarks/bench_render.py [--frames 600] [--difficulty 1]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.game import Game, CELL_SIZE
+
+
+def measure(dirty_rects, frames, difficulty=1):
+    """Return the mean frame time in milliseconds for one render path."""
+    game = Game(dirty_rects=dirty_rects, headless=True, seed=1, prefetch=0)
+    if difficulty != game.difficulty:
+        game.difficulty = difficulty
+        game.new_level()
+    draw = game._draw_dirty if dirty_rects else game._draw
+    span = game.maze.width * CELL_SIZE
+    start = time.perf_counter()
+    for frame in range(frames):
+        # Sweep the player back and forth along the diagonal, a pixel at a time
+        offset = frame % (2 * span)
+        x = min(offset, 2 * span - offset)
+        game.player_pos = pygame.Vector2(x + CELL_SIZE // 2, x + CELL_SIZE // 2)
+        draw()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--difficulty", type=int, default=1)
+    args = parser.parse_args()
+
+    full = measure(False, args.frames, args.difficulty)
+    dirty = measure(True, args.frames, args.difficulty)
+    print(f"full redraw: {full:.3f} ms/frame")
+    print(f"dirty rects: {dirty:.3f} ms/frame ({full / dirty:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
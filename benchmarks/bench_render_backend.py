@@ -0,0 +1,64 @@
+"""
+Frame time of the software blit path against the SDL2 texture backend
+(``Game(gpu=True)``), with a greedy agent playing.
+
+Without a hardware renderer (no GPU, or SDL's dummy video driver) the game
+falls back to software drawing; ``--software-renderer`` then runs the
+texture path on SDL's own software renderer, which checks it works but
+says nothing about GPU speed.
+
+Usage:
+    python benchmarks/bench_render_backend.py [--frames 600] [--headless] [--software-renderer]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.game import Game, CAPTION, WIDTH, HEIGHT, STATE_LEVEL_COMPLETE
+from Game.agents import GreedyAgent
+from Game.gpu_renderer import TextureRenderer
+
+
+def frame_ms(gpu, frames, headless, software_renderer):
+    """Mean milliseconds per rendered frame, and the backend that drew them."""
+    if headless:
+        # Keep a real window out of it, but let the texture path be tried
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    game = Game(gpu=gpu, seed=1, prefetch=0, controller=GreedyAgent(), max_fps=0)
+    if gpu and game.gpu is None and software_renderer:
+        game.gpu = TextureRenderer.create(CAPTION, (WIDTH, HEIGHT), accelerated=False)
+    backend = "textures" if game.gpu else "software blits"
+    total = 0.0
+    for _ in range(frames):
+        game.step()
+        if game.state == STATE_LEVEL_COMPLETE:
+            game.level += 1
+            game.new_level()
+        start = time.perf_counter()
+        game.render()
+        total += time.perf_counter() - start
+    pygame.quit()
+    return total / frames * 1000, backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video driver")
+    parser.add_argument("--software-renderer", action="store_true",
+                        help="run the texture path on SDL's software renderer if no GPU")
+    args = parser.parse_args()
+
+    for gpu in (False, True):
+        ms, backend = frame_ms(gpu, args.frames, args.headless, args.software_renderer)
+        print(f"{'gpu=' + str(gpu):>10}: {ms:7.3f} ms/frame  ({backend})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Size of a recorded session and how fast it plays back.
+
+A greedy agent plays for a few minutes of simulated time while being
+recorded; the replay is then played back headless, with and without
+rendering, and must end exactly where the recording did.
+
+Usage:
+    python benchmarks/bench_replay.py [--minutes 5] [--seed 1] [--render-every 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from Game.game import Game, SIM_RATE
+from Game.agents import GreedyAgent
+from Game.replay import play_replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--render-every", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "session.replay")
+        game = Game(headless=True, prefetch=0, seed=args.seed, controller=GreedyAgent(),
+                    record_output=path)
+        levels = game.run_headless(int(args.minutes * 60 * SIM_RATE))
+        game.replay.finish(game)
+        game.replay.save(path)
+        pygame.quit()
+        size = os.path.getsize(path)
+        print(f"recorded {args.minutes:g} min, {len(game.replay.moves)} moves, {levels} levels: "
+              f"{size} bytes ({size / args.minutes:.0f} bytes/min)")
+
+        for render_every in (0, args.render_every):
+            stats = play_replay(path, render_every=render_every)
+            label = f"render every {render_every}" if render_every else "no rendering"
+            print(f"{label:>18}: {stats['seconds']:6.2f}s  {stats['speed']:7.0f}x real time")
+    print("playback ended where the recording did: ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Startup time: from launching the game to its first frame on screen, and
+until the background audio loading has finished.
+
+Each run is a fresh interpreter so module imports and asset loading are
+measured cold (up to the OS file cache).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def child():
+    """Start one game and report its timings as JSON on stdout."""
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    import pygame  # noqa: F401  (its import cost is reported on its own)
+    imported = time.perf_counter() - start
+    from Game.game import Game
+
+    game = Game(headless=True, prefetch=0)
+    game.render()
+    first_frame = time.perf_counter() - start
+    game.assets.wait()
+    audio = time.perf_counter() - start
+    print(json.dumps({"pygame_import": imported, "first_frame": first_frame, "audio": audio}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    runs = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, __file__, "--child"], check=True,
+                                capture_output=True, text=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    for key, label in (("pygame_import", "import pygame"), ("first_frame", "first frame"),
+                       ("audio", "audio ready")):
+        values = [run[key] * 1000 for run in runs]
+        print(f"{label:>12}: median {statistics.median(values):7.1f} ms  "
+              f"min {min(values):7.1f} ms  max {max(values):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
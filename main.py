@@ -37,7 +37,7 @@ def main():
         pygame.mixer.init()
 
         # Start game
-        game = Game()
+        game = Game(gpu="--gpu" in sys.argv)
         game.run()
     except Exception as e:
         # Handle exceptions but don't disrupt gameplay